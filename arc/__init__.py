@@ -4,7 +4,9 @@ ArcController パッケージ
 このパッケージは、Monome Arcデバイス用のMIDIコントローラーアプリケーションを提供します。
 """
 
+import atexit
 import multiprocessing
+import multiprocessing.process
 import time
 from typing import Optional
 
@@ -14,8 +16,12 @@ from arc.app import main, run
 # パッケージのバージョン（必要に応じて）
 __version__ = "1.0.0"
 
+# 子プロセスは spawn で起動する。fork だと呼び出し元 (大きなヒープを持つホストアプリ) の
+# メモリを丸ごと複製してしまうため、必要なモジュールだけを読み込む新規インタプリタを使う
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
 # プロセス管理用のグローバル変数
-_arc_process: Optional[multiprocessing.Process] = None
+_arc_process: Optional[multiprocessing.process.BaseProcess] = None
 
 
 def start(midi: Optional[bool] = None, osc: Optional[bool] = None) -> bool:
@@ -33,7 +39,7 @@ def start(midi: Optional[bool] = None, osc: Optional[bool] = None) -> bool:
     if _arc_process is not None and _arc_process.is_alive():
         return False  # 既に実行中
 
-    _arc_process = multiprocessing.Process(target=run, kwargs={'midi': midi, 'osc': osc})
+    _arc_process = _MP_CONTEXT.Process(target=run, kwargs={'midi': midi, 'osc': osc})
     _arc_process.start()
     time.sleep(2)  # ArcControllerがMIDIポートを作成する時間を確保
 
@@ -72,5 +78,8 @@ def is_running() -> bool:
     return _arc_process is not None and _arc_process.is_alive()
 
 
+# 呼び出し元が stop() を忘れて終了しても子プロセスを残さない
+atexit.register(stop)
+
 # 公開するAPIを明示的に定義
 __all__ = ["main", "run", "start", "stop", "is_running"]
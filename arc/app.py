@@ -10,6 +10,11 @@ import logging
 
 from omegaconf import DictConfig, ListConfig
 
+try:
+    import uvloop
+except ImportError:  # uvloop は任意依存。未インストール (Windows 含む) の場合は標準ループを使う
+    uvloop = None
+
 from arc.controller.controller import Controller
 from arc.enums.enums import Mode
 from arc.models.model import Model
@@ -44,7 +49,12 @@ async def main(cfg: DictConfig | ListConfig) -> None:
 
     # MIDI送信機を初期化・起動
     midi_config = cfg.senders.midi
-    midi_sender = MidiSender(port_name=midi_config.port_name, channel=midi_config.channel, enabled=midi_config.enabled)
+    midi_sender = MidiSender(
+        port_name=midi_config.port_name,
+        channel=midi_config.channel,
+        enabled=midi_config.enabled,
+        min_interval_ms=midi_config.min_interval_ms,
+    )
     midi_sender.start()
 
     # OSC送信機を初期化・起動
@@ -78,6 +88,7 @@ async def main(cfg: DictConfig | ListConfig) -> None:
         model=model,
         threshold=cfg.mode.preset_select_mode.threshold,
         led_renderer=led_renderer,
+        lfo_engine=lfo_engine,
     )
     mode_mapping = {
         Mode.VALUE_SEND_MODE: value_send_mode,
@@ -90,6 +101,7 @@ async def main(cfg: DictConfig | ListConfig) -> None:
         model=model,
         mode_mapping=mode_mapping,
         long_press_duration=cfg.controller.long_press_duration,
+        delta_coalesce_interval=cfg.controller.delta_coalesce_interval,
     )
 
     serialosc = setup_serialosc(app)
@@ -129,7 +141,11 @@ def run(midi: bool | None = None, osc: bool | None = None) -> None:
     setup_logging(level=log_level)
 
     try:
-        asyncio.run(main(cfg))
+        # uvloop があればタイマー精度とソケット I/O のオーバーヘッドが改善される
+        if uvloop is not None:
+            uvloop.run(main(cfg))
+        else:
+            asyncio.run(main(cfg))
     except KeyboardInterrupt:
         LOGGER.info("Received exit signal, shutting down application")
 
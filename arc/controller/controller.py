@@ -11,7 +11,7 @@ import logging
 import typing
 
 # from enum import Enum  # no longer needed
-from typing import Optional
+from typing import Callable, Optional
 
 import monome
 import transitions
@@ -25,6 +25,7 @@ from arc.modes.layer_select_mode import LayerSelectMode
 from arc.modes.preset_select_mode import PresetSelectMode
 from arc.modes.ready_mode import ReadyMode
 from arc.modes.value_send_mode import ValueSendMode
+from arc.utils.hardware_spec import ARC_SPEC
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,17 +35,22 @@ STATES = [
     State(name=Mode.PRESET_SELECT_MODE, on_enter="_on_enter_preset_select", on_exit="_on_exit_preset_select"),
     State(name=Mode.LAYER_SELECT_MODE, on_enter="_on_enter_layer_select", on_exit="_on_exit_layer_select"),
     State(name=Mode.VALUE_SEND_MODE),
-    State(name=Mode.DISCONNECT_MODE),
+    State(name=Mode.DISCONNECT_MODE, on_enter="_on_enter_disconnect"),
 ]
 TRANSITIONS = [
     {"trigger": "press", "source": "*", "dest": Mode.LAYER_SELECT_MODE},
     {"trigger": "long_press", "source": Mode.LAYER_SELECT_MODE, "dest": Mode.PRESET_SELECT_MODE},
     {"trigger": "release", "source": "*", "dest": Mode.VALUE_SEND_MODE},
-    {"trigger": "_on_arc_ready", "source": "*", "dest": Mode.VALUE_SEND_MODE},
+    {"trigger": "_on_arc_ready", "source": "*", "dest": Mode.VALUE_SEND_MODE, "after": "_after_arc_ready"},
     {"trigger": "_on_arc_disconnect", "source": "*", "dest": Mode.DISCONNECT_MODE},
 ]
 
 
+def _is_noop_delta(mode: BaseMode) -> bool:
+    """モードが on_arc_delta をオーバーライドせず BaseMode の既定実装のままなら True を返す。"""
+    return getattr(type(mode), "on_arc_delta", None) is BaseMode.on_arc_delta
+
+
 class Controller(monome.ArcApp):
     """
     モノーム Arc デバイスからの入力を処理し、状態遷移や LED レンダリング、
@@ -54,6 +60,8 @@ class Controller(monome.ArcApp):
         machine (transitions.Machine): 入力イベントに応じた状態遷移を管理するステートマシン。
         _long_press_timer (Optional[asyncio.TimerHandle]): 長押し判定用タイマー。
         _is_pressed (bool): 現在の押下状態フラグ。
+        _pending_deltas (list[int]): 合算待ちのリングごとの Δ 値。
+        _delta_flush_handle (Optional[asyncio.TimerHandle]): Δ 合算フラッシュ用タイマー。
     """
 
     def __init__(
@@ -61,11 +69,25 @@ class Controller(monome.ArcApp):
         model: Model,
         mode_mapping: dict[Mode, BaseMode],
         long_press_duration: float = 0.2,
+        delta_coalesce_interval: float = 0.0,
     ) -> None:
+        """
+        Args:
+            model (Model): アプリケーション共通の状態モデル。
+            mode_mapping (dict[Mode, BaseMode]): 状態とモード実装の対応表。
+            long_press_duration (float): 長押しと判定するまでの時間 (秒)。
+            delta_coalesce_interval (float): ダイヤル Δ をリングごとに合算してから
+                モードへ委譲する間隔 (秒)。0 以下なら合算せず即時に委譲する。
+        """
         super().__init__()
         self.model = model
         self.state: Optional[Mode] = None
         self._modes: dict[Mode, BaseMode] = mode_mapping
+        # ダイヤルイベントは高頻度で届くため、モードごとの bound method を事前に引いておく。
+        # BaseMode の既定実装 (何もしない) のままのモードは None とし、呼び出し自体を省く
+        self._delta_handlers: dict[Mode, Optional[Callable[[int, int], None]]] = {
+            mode: None if _is_noop_delta(handler) else handler.on_arc_delta for mode, handler in mode_mapping.items()
+        }
         self._long_press_duration = long_press_duration
         self.ready_mode = typing.cast(ReadyMode, self._modes[Mode.READY_MODE])
         self.value_send_mode = typing.cast(ValueSendMode, self._modes[Mode.VALUE_SEND_MODE])
@@ -82,6 +104,10 @@ class Controller(monome.ArcApp):
         )
         self._long_press_timer: Optional[asyncio.TimerHandle] = None
         self._is_pressed: bool = False
+        self._delta_coalesce_interval = delta_coalesce_interval
+        self._pending_deltas: list[int] = [0] * ARC_SPEC.rings_per_device
+        self._delta_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # _get_loop() で初回のみ取得
 
     # ---------------------------------
     # public methods
@@ -104,39 +130,91 @@ class Controller(monome.ArcApp):
         """
         Arc デバイスのダイヤルイベントを受け取り、現在のモードに委譲する。
 
+        ``delta_coalesce_interval`` が正の場合は Δ をリングごとに合算しておき、
+        間隔ごとに 1 回だけ委譲する。Δ は整数なので合算しても精度は失われない。
+
         Args:
             ring_idx (int): ダイヤル番号。
             delta (int): ダイヤルの変化量。
         """
-        state = self.state
-        if state is None:
-            LOGGER.error("State is None: cannot dispatch on_arc_delta")
+        if delta == 0:  # 変化量 0 のイベントはどのモードでも副作用がないため破棄する
             return
 
-        handler = self._modes.get(state)
-        if handler is not None:
-            handler.on_arc_delta(ring_idx, delta)
-        else:
-            LOGGER.error("Unknown state: %s", state)
+        if self._delta_coalesce_interval <= 0:
+            self._dispatch_delta(ring_idx, delta)
+            return
+
+        self._pending_deltas[ring_idx] += delta
+        if self._delta_flush_handle is None:
+            self._delta_flush_handle = self._get_loop().call_later(self._delta_coalesce_interval, self._flush_deltas)
 
     def on_arc_ready(self) -> None:
         """
         Arc デバイスが接続されたときに呼び出されるコールバック。
         """
         self._on_arc_ready()  # type: ignore
-        self.ready_mode.on_arc_ready(self.arc)
         LOGGER.info("Arc ready")
 
     def on_arc_disconnect(self) -> None:
         """
         Arc デバイスが切断されたときに呼び出されるコールバック。"""
+        self._discard_pending_deltas()
         self._on_arc_disconnect()  # type: ignore
-        self.disconnect_mode.on_arc_disconnect()
         LOGGER.info("Arc disconnected")
 
     # ---------------------------------
     # private methods
     # ---------------------------------
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        実行中のイベントループを返す。初回呼び出し時に取得してキャッシュする。
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
+
+    def _dispatch_delta(self, ring_idx: int, delta: int) -> None:
+        """
+        現在の状態に対応するモードへダイヤルの変化量を委譲する。
+
+        Args:
+            ring_idx (int): ダイヤル番号。
+            delta (int): ダイヤルの変化量。
+        """
+        state = self.state
+        if state is None:
+            LOGGER.error("State is None: cannot dispatch on_arc_delta")
+            return
+
+        handler = self._delta_handlers.get(state)
+        if handler is not None:
+            handler(ring_idx, delta)
+        elif state not in self._delta_handlers:
+            LOGGER.error("Unknown state: %s", state)
+
+    def _flush_deltas(self) -> None:
+        """
+        合算済みの Δ を持つリングだけを現在のモードへ委譲し、合算値をリセットする。
+        """
+        if self._delta_flush_handle is not None:
+            self._delta_flush_handle.cancel()
+            self._delta_flush_handle = None
+        pending = self._pending_deltas
+        for ring_idx, delta in enumerate(pending):
+            if delta:
+                pending[ring_idx] = 0
+                self._dispatch_delta(ring_idx, delta)
+
+    def _discard_pending_deltas(self) -> None:
+        """
+        合算待ちの Δ とフラッシュ用タイマーを破棄する。
+        """
+        if self._delta_flush_handle is not None:
+            self._delta_flush_handle.cancel()
+            self._delta_flush_handle = None
+        self._pending_deltas = [0] * ARC_SPEC.rings_per_device
+
     def _on_key_pressed(self) -> None:
         """
         押下イベント発生時の内部処理。
@@ -146,6 +224,7 @@ class Controller(monome.ArcApp):
         - ステートマシンを押下トリガ (`press`) に遷移させる
         """
         self._is_pressed = True
+        self._flush_deltas()  # 遷移前のモードで操作された Δ は遷移前のモードへ届ける
         self._start_long_press_timer()
         self.trigger("press")  # type: ignore
 
@@ -158,6 +237,7 @@ class Controller(monome.ArcApp):
         - 長押し判定用タイマーをキャンセル
         """
         self._is_pressed = False
+        self._flush_deltas()
         self.trigger("release")  # type: ignore
         self._cancel_long_press_timer()
 
@@ -167,8 +247,7 @@ class Controller(monome.ArcApp):
         既存のタイマーがあればキャンセルしてから新たに開始する。
         """
         self._cancel_long_press_timer()
-        loop = asyncio.get_running_loop()
-        self._long_press_timer = loop.call_later(self._long_press_duration, self._on_long_press)
+        self._long_press_timer = self._get_loop().call_later(self._long_press_duration, self._on_long_press)
 
     def _cancel_long_press_timer(self) -> None:
         """
@@ -183,12 +262,20 @@ class Controller(monome.ArcApp):
         設定時間経過後も押下状態が継続している場合に長押しイベントを発火させる。
         """
         if self._is_pressed:
+            self._flush_deltas()
             self.trigger("long_press")  # type: ignore
             self._cancel_long_press_timer()
 
     # ---------------------------------
     # state callbacks
     # ---------------------------------
+    def _after_arc_ready(self, event: EventData) -> None:  # noqa: D401
+        """接続遷移の完了後に LedRenderer の初期化と LFO エンジンの起動を行う。"""
+        self.ready_mode.on_arc_ready(self.arc)
+
+    def _on_enter_disconnect(self, event: EventData) -> None:  # noqa: D401
+        self.disconnect_mode.on_arc_disconnect()
+
     def _on_enter_layer_select(self, event: EventData) -> None:  # noqa: D401
         self.layer_select_mode.on_enter()
 
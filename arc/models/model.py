@@ -6,7 +6,7 @@ from typing import Iterator, List
 
 from arc.enums.enums import LedStyle, LfoStyle, ValueStyle
 from arc.utils.hardware_spec import ARC_SPEC
-from arc.utils.util import clamp, fmt
+from arc.utils.util import fmt
 
 LOGGER = logging.getLogger(__name__)
 
@@ -87,11 +87,14 @@ class LayerState:
         return iter(self.rings)
 
 
-@dataclass
+@dataclass(slots=True)
 class RingState:
     """
     1 つのリングに関するランタイム状態を保持するデータクラス。
 
+    エンコーダ入力や LFO 更新のたびに属性アクセスが発生するため ``slots=True`` とし、
+    インスタンス辞書を持たせずに属性の読み書きを高速化している。
+
     Attributes:
         current_value (float): 現在値 (0.0‒1.0 など)。
         cc_number (int): 対応する MIDI CC 番号。
@@ -129,10 +132,13 @@ class RingState:
         self.led_style = LedStyle(preset["led_style"])
         self.lfo_style = LfoStyle(preset["lfo_style"])
         # ValueStyle が BIPOLAR に切り替わった場合、論理的な中央値をセットする
-        if self.value_style == ValueStyle.BIPOLAR or self.led_style == LedStyle.BIPOLAR:
+        if self.value_style is ValueStyle.BIPOLAR or self.led_style is LedStyle.BIPOLAR:
             old_value = self.value
             self.value = 0.5
-            LOGGER.debug("[CC%d] value: %s -> %s (preset: BIPOLAR)", self.cc_number, fmt(old_value), fmt(self.value))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "[CC%d] value: %s -> %s (preset: BIPOLAR)", self.cc_number, fmt(old_value), fmt(self.value)
+                )
 
     def apply_delta(self, delta: int) -> None:
         """リングの現在値をスタイルに応じて更新する。
@@ -144,12 +150,18 @@ class RingState:
         new_val = self.value + delta * self.value_gain
 
         # --- スタイル別の丸め・制限 -------------------------------
-        if style != ValueStyle.INFINITE:  # 無限値は制限しない
-            new_val = clamp(new_val, 0.0, 1.0)
+        # 範囲は常に [0, 1] 固定なので clamp() の呼び出しと範囲検証を省きインラインで比較する
+        if style is not ValueStyle.INFINITE:  # 無限値は制限しない
+            if new_val < 0.0:
+                new_val = 0.0
+            elif new_val > 1.0:
+                new_val = 1.0
 
         old_value = self.value
         self.value = new_val
-        LOGGER.debug("[CC%d] value: %s -> %s", self.cc_number, fmt(old_value), fmt(self.value))
+        # fmt() は引数として即時評価されるため、DEBUG 無効時は呼び出し自体を省く
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("[CC%d] value: %s -> %s", self.cc_number, fmt(old_value), fmt(new_val))
 
     def apply_lfo_delta(self, delta: float) -> None:
         """LFO 周波数を 0.0‒1.0 範囲で更新する。
@@ -158,9 +170,26 @@ class RingState:
             delta (float): 入力エンコーダの増分。
         """
         old_freq = self.lfo_frequency
-        new_val = self.lfo_frequency + delta * self.lfo_freq_gain
-        self.lfo_frequency = clamp(new_val, 0.0, 1.0)
-        LOGGER.debug("[CC%d] lfo_frequency: %s -> %s", self.cc_number, fmt(old_freq), fmt(self.lfo_frequency))
+        new_val = old_freq + delta * self.lfo_freq_gain
+        if new_val < 0.0:
+            new_val = 0.0
+        elif new_val > 1.0:
+            new_val = 1.0
+        self.lfo_frequency = new_val
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("[CC%d] lfo_frequency: %s -> %s", self.cc_number, fmt(old_freq), fmt(new_val))
+
+    @property
+    def render_signature(self) -> tuple:
+        """LED 描画結果に影響する属性のみを束ねたタプルを返す。
+
+        プリセット変更の前後でこの値が等しければ LED 表示は変化しないため、
+        呼び出し側は再描画 (OSC 送信) を省略できる。
+
+        Returns:
+            tuple: ``(led_style, value_style, value)``。
+        """
+        return (self.led_style, self.value_style, self.value)
 
     def cycle_preset(self, step: int = 1) -> None:
         """プリセットインデックスを循環的に進める。"""
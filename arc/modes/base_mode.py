@@ -2,46 +2,29 @@
 mode.base_mode
 --------------
 
-すべてのモードクラスが実装すべきコールバックインターフェースを定義する抽象基底クラス
+すべてのモードクラスが共有するコールバックインターフェースを定義する基底クラス
 (:class:`BaseMode`) を提供するモジュール。
 
-monome Arc デバイスからの入力イベントごとに 4 つのメソッド
-(:py:meth:`on_arc_ready`, :py:meth:`on_arc_disconnect`,
-:py:meth:`on_arc_delta`, :py:meth:`on_arc_key`) を定義し、
-状態を持たないピュアインターフェースとしている。
-"""
+monome Arc デバイスからの入力イベントごとに 2 つのフック
+(:py:meth:`on_arc_delta`, :py:meth:`on_arc_key`) を何もしない既定実装として定義し、
+サブクラスは必要なものだけをオーバーライドする。
 
-from abc import ABC, abstractmethod
+デバイスの接続／切断はコントローラのステートマシンが遷移コールバックとして
+扱うため、本インターフェースには含めない。
+"""
 
-import monome
+from abc import ABC
 
 
 class BaseMode(ABC):
     """Arc 入力イベント用の共通インターフェース。
 
-    サブクラスは以下 4 つの抽象メソッドを実装すること:
+    サブクラスは以下のフックのうち必要なものだけをオーバーライドする:
 
-    * on_arc_ready(arc): デバイス接続時
-    * on_arc_disconnect(): デバイス切断時
     * on_arc_delta(ring_idx, delta): エンコーダ回転
     * on_arc_key(x, pressed): キー押下／離上
     """
 
-    @abstractmethod
-    def on_arc_ready(self, arc: monome.Arc) -> None:
-        """Arc デバイス接続完了時に呼び出されるフック。
-
-        Args:
-            arc (monome.Arc): 接続された Arc デバイス。
-        """
-        pass
-
-    @abstractmethod
-    def on_arc_disconnect(self) -> None:
-        """Arc デバイス切断時に呼び出されるフック。"""
-        pass
-
-    @abstractmethod
     def on_arc_delta(self, ring_idx: int, delta: int) -> None:
         """リングの回転入力を受け取るフック。
 
@@ -51,7 +34,6 @@ class BaseMode(ABC):
         """
         pass
 
-    @abstractmethod
     def on_arc_key(self, x: int, pressed: bool) -> None:
         """キー押下／離上入力を受け取るフック。
 
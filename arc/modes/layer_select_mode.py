@@ -16,8 +16,6 @@ mode.layer_select_mode
 
 from __future__ import annotations
 
-import monome
-
 from arc.models.model import Model
 from arc.modes.base_mode import BaseMode
 from arc.services.renderers.led_renderer import LedRenderer
@@ -39,18 +37,6 @@ class LayerSelectMode(BaseMode):
         self.model = model
         self.led_renderer = led_renderer
 
-    def on_arc_ready(self, arc: monome.Arc) -> None:
-        """Arc デバイス接続完了時のコールバック。現在は特別な処理を行わない。
-
-        Args:
-            arc (monome.Arc): 接続された Arc デバイス。
-        """
-        pass
-
-    def on_arc_disconnect(self) -> None:
-        """Arc デバイス切断時のコールバック。現在は特別な処理を行わない。"""
-        pass
-
     def on_arc_key(self, x: int, pressed: bool) -> None:
         """キー押下／離上イベントを処理し、レイヤー選択表示を制御する。
 
@@ -63,10 +49,6 @@ class LayerSelectMode(BaseMode):
         else:
             self._refresh_active_layer_led()
 
-    def on_arc_delta(self, ring_idx: int, delta: int) -> None:
-        """レイヤー選択モードではリング回転を無視するため何もしない。"""
-        pass
-
     def on_enter(self) -> None:
         """レイヤー選択モードへの遷移時に呼ばれる。
 
@@ -20,14 +20,11 @@ mode.preset_select_mode
 
 from __future__ import annotations
 
-import math
-from collections import defaultdict
-
-import monome
-
 from arc.models.model import Model
 from arc.modes.base_mode import BaseMode
+from arc.services.lfo.lfo_engine import LFOEngine
 from arc.services.renderers.led_renderer import LedRenderer
+from arc.utils.hardware_spec import ARC_SPEC
 
 
 class PresetSelectMode(BaseMode):
@@ -37,40 +34,30 @@ class PresetSelectMode(BaseMode):
         model (Model): アプリケーション共通の状態モデル。
         threshold (int): プリセットを 1 ステップ変更するのに必要なエンコーダ累積値。
         led_renderer (LedRenderer): LED 描画を担当するレンダラ。
+        lfo_engine (LFOEngine): プリセット変更で LFO が有効になった際に
+            休止中のループを起こすための LFO エンジン。
 
     Attributes:
         model (Model): アプリケーションの状態モデル。
         threshold (int): プリセット変更しきい値。
         led_renderer (LedRenderer): LED レンダラ。
-        _acc_deltas (defaultdict[int, int]): 各リングごとの累積 Δ 値。
+        _acc_deltas (list[int]): 各リングごとの累積 Δ 値 (リング数固定のためリストで保持)。
+        _highlight_shown (bool): on_enter のハイライトが表示されたままか。
     """
 
-    def __init__(self, model: Model, threshold: int, led_renderer: LedRenderer) -> None:
+    def __init__(
+        self,
+        model: Model,
+        threshold: int,
+        led_renderer: LedRenderer,
+        lfo_engine: LFOEngine,
+    ) -> None:
         self.model = model
         self.threshold = threshold
         self.led_renderer = led_renderer
-        self._acc_deltas = defaultdict(int)
-
-    def on_arc_ready(self, arc: monome.Arc) -> None:
-        """Arc デバイス接続完了時に呼び出されるコールバック。
-
-        Args:
-            arc (monome.Arc): 接続された Arc デバイス。
-        """
-        pass
-
-    def on_arc_disconnect(self) -> None:
-        """Arc デバイス切断時のコールバック。現在は特別な処理を行わない。"""
-        pass
-
-    def on_arc_key(self, x: int, pressed: bool) -> None:
-        """Arc のキー押下／解放イベントを受け取る。
-
-        Args:
-            x (int): キー番号。PresetSelectMode では使用しない。
-            pressed (bool): 押下時 True、解放時 False。
-        """
-        pass
+        self.lfo_engine = lfo_engine
+        self._acc_deltas: list[int] = [0] * ARC_SPEC.rings_per_device
+        self._highlight_shown = False
 
     def on_arc_delta(self, ring_idx: int, delta: int) -> None:
         """エンコーダの回転イベントを処理するメインハンドラ。
@@ -82,20 +69,32 @@ class PresetSelectMode(BaseMode):
             ring_idx (int): 回転したリング番号 (0‒3)。
             delta (int): 回転量。時計回りが正、反時計回りが負。
         """
-        self.led_renderer.set_render_block(blocked=False)
-        self.led_renderer.render_value(ring_idx, self.model[ring_idx])
+        if self._highlight_shown:
+            # 最初の回転でのみハイライトを解除してレイヤーを表示する。
+            # highlight() が差分キャッシュを更新しているため、差分描画だけで上書きできる。
+            # 以降のしきい値未満の Δ では LED の見た目が変わらないため描画しない
+            self._highlight_shown = False
+            self.led_renderer.set_render_block(blocked=False)
+            self.led_renderer.render_layer(self.model.active_layer)
         acc = self._acc_deltas[ring_idx] + delta  # 累積値を更新
-        steps = math.trunc(acc / self.threshold)  # ステップ数を計算
+        # ゼロ方向への切り捨て除算を整数演算のみで行う (float 往復と math.trunc を省く)
+        steps = acc // self.threshold if acc >= 0 else -(-acc // self.threshold)
         self._acc_deltas[ring_idx] = acc - steps * self.threshold  # 残余を保持
         if steps == 0:
             return
         ring_state = self.model[ring_idx]
+        before = ring_state.render_signature
         ring_state.cycle_preset(steps)
+        self.lfo_engine.wake()  # lfo_style が変わった可能性があるので休止中のループを起こす
+        if ring_state.render_signature == before:
+            return  # 見た目が変わらないプリセット間の移動では再描画を省く
         self.led_renderer.render_layer(self.model.active_layer, ignore_cache=True)
 
     def _reset_acc(self) -> None:
         """すべてのリングの累積 Δ をリセットする。"""
-        self._acc_deltas.clear()
+        acc_deltas = self._acc_deltas
+        for i in range(len(acc_deltas)):
+            acc_deltas[i] = 0
 
     def on_enter(self) -> None:
         """プリセット選択モードへの遷移時に呼ばれる。
@@ -107,6 +106,7 @@ class PresetSelectMode(BaseMode):
         self.led_renderer.set_render_block(blocked=True)
         self.model.cycle_layer(-1)
         self.led_renderer.highlight(self.model.active_layer_idx)
+        self._highlight_shown = True
 
     def on_exit(self) -> None:
         """プリセット選択モードから抜ける際に呼ばれる。
@@ -116,5 +116,6 @@ class PresetSelectMode(BaseMode):
         - アクティブレイヤーを再描画して最新状態を反映
         """
         self._reset_acc()
+        self._highlight_shown = False
         self.led_renderer.set_render_block(blocked=False)
         self.led_renderer.render_layer(self.model.active_layer, ignore_cache=True)
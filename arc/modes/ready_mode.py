@@ -51,19 +51,5 @@ class ReadyMode(BaseMode):
         if not self._lfo_engine.running:
             self._lfo_engine.start()
 
-        # 初回のrendering
-        for layer in self._model:
-            for ring_idx, ring_state in enumerate(layer):
-                self._led_renderer.render_value(ring_idx, ring_state)
-
-    def on_arc_disconnect(self) -> None:
-        """ReadyMode では切断イベントを無視する。"""
-        pass
-
-    def on_arc_delta(self, ring_idx: int, delta: int) -> None:
-        """ReadyMode ではリング回転イベントを無視する。"""
-        pass
-
-    def on_arc_key(self, x: int, pressed: bool) -> None:
-        """ReadyMode ではキー入力を無視する。"""
-        pass
+        # 初回のrendering: 表示されるのはアクティブレイヤーのみなので、それだけを 1 回の送信で描画する
+        self._led_renderer.render_layer(self._model.active_layer, ignore_cache=True)
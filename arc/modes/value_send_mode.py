@@ -10,8 +10,6 @@ mode.value_send_mode
 * いずれの場合も :class:`renderer.led_renderer.LedRenderer` で LED を即時更新する
 """
 
-import monome
-
 from arc.enums.enums import LfoStyle, ValueStyle
 from arc.models.model import Model
 from arc.modes.base_mode import BaseMode
@@ -48,22 +46,6 @@ class ValueSendMode(BaseMode):
         self.osc_sender = osc_sender
         self.osc_address_prefix = osc_address_prefix or "/arc"
 
-    def on_arc_ready(self, arc: monome.Arc) -> None:
-        """ValueSendMode では接続イベントを無視する。
-
-        Args:
-            arc (monome.Arc): 接続された Arc デバイス。
-        """
-        pass
-
-    def on_arc_disconnect(self) -> None:
-        """デバイス切断イベントを無視する。"""
-        pass
-
-    def on_arc_key(self, x: int, pressed: bool) -> None:
-        """キー入力を無視する。"""
-        pass
-
     def on_arc_delta(self, ring_idx: int, delta: int) -> None:
         """リング回転を処理し、値または LFO 周波数を更新して LED を再描画する。
 
@@ -72,7 +54,7 @@ class ValueSendMode(BaseMode):
             delta (int): 回転量。時計回りが正、反時計回りが負。
         """
         ring_state = self.model[ring_idx]
-        if ring_state.lfo_style == LfoStyle.STATIC:
+        if ring_state.lfo_style is LfoStyle.STATIC:
             ring_state.apply_delta(delta)
             # STATIC の場合のみ手動操作時に MIDI/OSC 送信
             self._send_if_needed(ring_idx, ring_state)
@@ -80,13 +62,14 @@ class ValueSendMode(BaseMode):
             ring_state.apply_lfo_delta(delta)
             # LFO が有効な場合は LFOEngine が常時送信するため、ここでは送信しない
         self.led_renderer.render_value(ring_idx, ring_state)
+        self.led_renderer.flush()
 
     def _send_if_needed(self, ring_idx: int, ring_state) -> None:
         """MIDI CC および OSC を送信する内部ヘルパー。"""
         # MIDI送信
-        if ring_state.value_style == ValueStyle.MIDI_14BIT:
+        if ring_state.value_style is ValueStyle.MIDI_14BIT:
             self.midi_sender.send_cc_14bit(ring_state.cc_number, ring_state.value)
-        elif ring_state.value_style == ValueStyle.MIDI_7BIT:
+        elif ring_state.value_style is ValueStyle.MIDI_7BIT:
             self.midi_sender.send_cc_7bit(ring_state.cc_number, ring_state.value)
         
         # OSC送信
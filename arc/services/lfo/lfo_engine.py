@@ -7,12 +7,14 @@ asyncio タスクとして動作し、各リングの LFO を計算して LED 
 
 import asyncio
 import logging
+from typing import Callable
 
 from arc.enums.enums import LfoStyle, ValueStyle
 from arc.models.model import Model, RingState
-from arc.services.lfo.lfo_styles import LFO_STYLE_MAP, BaseLfoStyle, get_lfo_instance
+from arc.services.lfo.lfo_styles import BaseLfoStyle, get_lfo_instance
 from arc.services.renderers.led_renderer import LedRenderer
 from arc.services.sender.control_sender import AiOscSender, MidiSender
+from arc.utils.hardware_spec import ARC_SPEC
 
 LOGGER = logging.getLogger(__name__)
 
@@ -57,8 +59,19 @@ class LFOEngine:
         self.fps = fps
         self.running: bool = False
         self._task: asyncio.Task | None = None
+        # 以下の LFO 関連リストは ``layer_idx * rings_per_device + ring_idx`` をスロット番号として引く。
+        # 毎フレームのタプル生成とハッシュ計算を避けるため dict ではなく list で保持し、必要に応じて伸長する
+        self._rings_per_layer = ARC_SPEC.rings_per_device
         # 各レイヤー・リングごとに保持する LFO
-        self._lfos_on_model: dict[tuple[int, int], BaseLfoStyle] = {}
+        self._lfos_on_model: list[BaseLfoStyle | None] = []
+        # 各 LFO を生成したときの LfoStyle。スタイル変更の検出に使う
+        self._lfo_styles_on_model: list[LfoStyle | None] = []
+        # 各 LFO の束縛済み update メソッド。毎フレームの属性解決を省く
+        self._lfo_updates: list[Callable[[RingState, float], float] | None] = []
+        # (layer_idx, ring_idx, ring_state) の平坦なリスト。ループ開始時に構築する
+        self._ring_entries: list[tuple[int, int, RingState]] = []
+        # 全リングが STATIC の間ループを休止させ、wake() で再開させるためのイベント
+        self._wake_event = asyncio.Event()
 
     # ---------------------------------------------------------------------
     # Public API
@@ -95,6 +108,14 @@ class LFOEngine:
         finally:
             self._task = None
 
+    def wake(self) -> None:
+        """休止中のループを再開させる。
+
+        リングの ``lfo_style`` を変更した呼び出し側が通知に使う。休止していない場合は
+        何も起こらない。
+        """
+        self._wake_event.set()
+
     # ---------------------------------------------------------------------
     # 内部: メインループ
     # ---------------------------------------------------------------------
@@ -106,22 +127,57 @@ class LFOEngine:
         ``await asyncio.sleep(max(0, target - loop.time()))`` で待機する。
         更新が遅延して ``sleep`` 時刻を過ぎていた場合は ``target`` を現在時刻へ
         リセットして追いつく。
+
+        各フレームはまず全リングの LFO 値を進めて確定させ、その後でアクティブ
+        レイヤーの確定値だけを LED へ描画する。描画 I/O が LFO 計算の途中に
+        挟まらないため、送信が詰まっても他リングの値更新は遅れない。
+
+        全リングが STATIC の間はフレームを回す必要がないため、``wake()`` が
+        呼ばれるまでイベント待ちで休止する。休止判定には LFO 更新ループで数えた
+        有効リング数を使い、毎フレーム別途全リングを走査することはしない。
+        全リングの走査 (``_has_active_lfo()``) は起動時・休止直前・起床時にだけ行う。
         """
         frame_interval = 1.0 / self.fps
         loop = asyncio.get_running_loop()
         prev = loop.time()
         target = prev  # 次フレーム予定時刻
+        # レイヤー／リング構成は起動後に変化しないため、毎フレームの二重 enumerate を避ける
+        self._ring_entries = self._build_ring_entries()
 
         try:
+            active = self._has_active_lfo()
             while self.running:
+                if not active:
+                    # 休止: 起床後は経過時間を dt に含めないよう基準時刻を取り直す
+                    self._wake_event.clear()
+                    # active は前フレームの集計なので、その sleep 中に呼ばれた wake() を
+                    # clear() で取りこぼさないよう、休止直前に全リングを確認し直す
+                    if self._has_active_lfo():
+                        active = True
+                        continue
+                    LOGGER.info("LfoEngine: all rings are STATIC, idling until wake()")
+                    await self._wake_event.wait()
+                    LOGGER.info("LfoEngine: woken up")
+                    prev = target = loop.time()
+                    active = self._has_active_lfo()
+                    continue
+
                 now = loop.time()
                 dt = now - prev
                 prev = now
 
-                # ----- LFO 更新 & LED 描画 --------------------------------
-                for layer_idx, layer in enumerate(self.model):
-                    for ring_idx, ring_state in enumerate(layer):
-                        self._update_ring(layer_idx, ring_idx, ring_state, dt)
+                # ----- LFO 更新 (全リングの値を確定) ----------------------
+                # 更新したリング数を数え、0 になったら次の周回で休止する
+                active = 0
+                update_ring = self._update_ring
+                for layer_idx, ring_idx, ring_state in self._ring_entries:
+                    if ring_state.lfo_style is LfoStyle.STATIC:
+                        continue  # STATIC はメソッド呼び出し自体を省く
+                    update_ring(layer_idx, ring_idx, ring_state, dt)
+                    active += 1
+
+                # ----- LED 描画 (確定値のみ) ------------------------------
+                self._render_active_layer()
 
                 # ----- FPS 制御: ドリフト補正あり -------------------------
                 target += frame_interval
@@ -140,53 +196,104 @@ class LFOEngine:
     # -----------------------------------------------------------------
     # 内部: ヘルパーメソッド
     # -----------------------------------------------------------------
-    def _get_or_create_lfo(self, key: tuple[int, int], ring_state) -> BaseLfoStyle:
-        """キーに対応する LFO インスタンスを取得または生成する。"""
-        expected_cls = LFO_STYLE_MAP.get(ring_state.lfo_style)
-        lfo = self._lfos_on_model.get(key)
+    def _build_ring_entries(self) -> list[tuple[int, int, RingState]]:
+        """Model の全リングを ``(layer_idx, ring_idx, ring_state)`` の平坦なリストにする。"""
+        return [
+            (layer_idx, ring_idx, ring_state)
+            for layer_idx, layer in enumerate(self.model)
+            for ring_idx, ring_state in enumerate(layer)
+        ]
+
+    def _has_active_lfo(self) -> bool:
+        """STATIC 以外の LFO スタイルを持つリングが 1 つでもあれば True を返す。
+
+        全リングを走査するため、フレームごとではなく起動時・休止直前・起床時にだけ呼ぶ。
+        """
+        for _, _, ring_state in self._ring_entries:
+            if ring_state.lfo_style is not LfoStyle.STATIC:
+                return True
+        return False
+
+    def _get_or_create_lfo(self, slot: int, ring_state) -> BaseLfoStyle:
+        """スロットに対応する LFO インスタンスを取得または生成する。
+
+        生成時の LfoStyle を保持しておき、毎フレームのスタイル変更判定は
+        ``LFO_STYLE_MAP`` を引かずに enum の同一性比較だけで行う。
+        """
+        if slot >= len(self._lfos_on_model):
+            # 未使用スロットは None で埋めて伸長する (生成時のみ通る)
+            pad = [None] * (slot + 1 - len(self._lfos_on_model))
+            self._lfos_on_model.extend(pad)
+            self._lfo_styles_on_model.extend(pad)
+            self._lfo_updates.extend(pad)
+
+        style = ring_state.lfo_style
+        lfo = self._lfos_on_model[slot]
 
         # スタイルが変わったらインスタンスを作り直す
-        if lfo is None or lfo.__class__ is not expected_cls:
-            before_style = None if lfo is None else lfo.style_enum
+        if lfo is None or self._lfo_styles_on_model[slot] is not style:
             LOGGER.info(
                 "LFO style changed, re-instantiating. before=%s, after=%s",
-                before_style,
-                ring_state.lfo_style,
+                self._lfo_styles_on_model[slot],
+                style,
             )
-            lfo = get_lfo_instance(ring_state.lfo_style)
-            self._lfos_on_model[key] = lfo
+            lfo = get_lfo_instance(style)
+            self._lfos_on_model[slot] = lfo
+            self._lfo_styles_on_model[slot] = style
+            self._lfo_updates[slot] = lfo.update
         return lfo
 
     def _update_ring(self, layer_idx: int, ring_idx: int, ring_state: RingState, dt: float) -> None:
-        """単一リングの値を更新し、必要なら LED を描画する。"""
-        if ring_state.lfo_style == LfoStyle.STATIC:
+        """単一リングの値を更新し、MIDI/OSC を送信する。LED 描画は行わない。
+
+        Args:
+            layer_idx (int): レイヤーインデックス。
+            ring_idx (int): リングインデックス。
+            ring_state (RingState): 対象リングの状態。
+            dt (float): 前フレームからの経過時間 (秒)。
+        """
+        style = ring_state.lfo_style
+        if style is LfoStyle.STATIC:
             return
 
-        key = (layer_idx, ring_idx)
-        lfo = self._get_or_create_lfo(key, ring_state)
+        slot = layer_idx * self._rings_per_layer + ring_idx  # LFO 関連リストのスロット番号
+        # 定常時はスタイルの同一性だけを確認し、束縛済みの update を直接呼ぶ
+        styles = self._lfo_styles_on_model
+        if slot < len(styles) and styles[slot] is style:
+            update = self._lfo_updates[slot]
+        else:
+            update = self._get_or_create_lfo(slot, ring_state).update
 
         # 値更新
         old_value = ring_state.value
-        ring_state.value = lfo.update(ring_state, dt)
-
-        # アクティブレイヤーのみ LED 描画
-        if layer_idx == self.model.active_layer_idx:
-            self.led_renderer.render_value(ring_idx, ring_state)
+        ring_state.value = update(ring_state, dt)
 
         # LFO が有効なリングは常に MIDI/OSC 送信
         self._send_if_needed(layer_idx, ring_idx, ring_state, old_value)
 
+    def _render_active_layer(self) -> None:
+        """アクティブレイヤーのうち LFO が有効なリングの確定値を LED へ描画する。
+
+        各リングはバッファへ書き込むだけで、Arc への送信はフレーム終端の
+        ``flush()`` で 1 回にまとめる。
+        """
+        render_value = self.led_renderer.render_value
+        for ring_idx, ring_state in enumerate(self.model.active_layer):
+            if ring_state.lfo_style is not LfoStyle.STATIC:
+                render_value(ring_idx, ring_state)
+        self.led_renderer.flush()
+
     def _send_if_needed(self, layer_idx: int, ring_idx: int, ring_state: RingState, old_value: float) -> None:
         """値が変化した場合、または LFO が有効な場合に MIDI/OSC を送信する。"""
         # LFO が有効な場合は常に送信（値の微小変化も含む）
         # STATIC の場合は値が実際に変わったときのみ送信
-        should_send = ring_state.lfo_style != LfoStyle.STATIC or abs(ring_state.value - old_value) > 1e-6
+        should_send = ring_state.lfo_style is not LfoStyle.STATIC or abs(ring_state.value - old_value) > 1e-6
 
         if should_send:
             # MIDI送信
-            if ring_state.value_style == ValueStyle.MIDI_14BIT:
+            if ring_state.value_style is ValueStyle.MIDI_14BIT:
                 self.midi_sender.send_cc_14bit(ring_state.cc_number, ring_state.value)
-            elif ring_state.value_style == ValueStyle.MIDI_7BIT:
+            elif ring_state.value_style is ValueStyle.MIDI_7BIT:
                 self.midi_sender.send_cc_7bit(ring_state.cc_number, ring_state.value)
             
             # OSC送信
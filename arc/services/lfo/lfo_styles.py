@@ -54,7 +54,10 @@ class SineLfoStyle(BaseLfoStyle):
 
     def update(self, ring_state: RingState, dt: float) -> float:
         ring_state.lfo_phase = (ring_state.lfo_phase + ring_state.lfo_frequency * dt) % 1.0
-        return ring_state.lfo_amplitude * math.sin(2.0 * math.pi * ring_state.lfo_phase)
+        amplitude = ring_state.lfo_amplitude
+        if amplitude == 0.0:
+            return 0.0  # 位相だけ進め、結果が 0 と決まっている sin 計算は省く
+        return amplitude * math.sin(math.tau * ring_state.lfo_phase)
 
 
 class SawLfoStyle(BaseLfoStyle):
@@ -89,8 +92,10 @@ class TriangleLfoStyle(BaseLfoStyle):
         return LfoStyle.TRIANGLE
 
     def update(self, ring_state: RingState, dt: float) -> float:
-        ring_state.lfo_phase = (ring_state.lfo_phase + ring_state.lfo_frequency * dt) % 1.0
-        tri = 4.0 * abs(ring_state.lfo_phase - 0.5) - 1.0  # -1..1
+        phase = (ring_state.lfo_phase + ring_state.lfo_frequency * dt) % 1.0
+        ring_state.lfo_phase = phase
+        # 4 * |phase - 0.5| - 1 を区間ごとの 1 次式に展開し、abs() の呼び出しを省く (-1..1)
+        tri = 1.0 - 4.0 * phase if phase < 0.5 else 4.0 * phase - 3.0
         return ring_state.lfo_amplitude * tri
 
 
@@ -103,6 +108,8 @@ class PerlinLfoStyle(BaseLfoStyle):
 
     def update(self, ring_state: RingState, dt: float) -> float:
         ring_state.lfo_phase += ring_state.lfo_frequency * dt
+        if ring_state.lfo_amplitude == 0.0:
+            return 0.0  # 位相だけ進め、結果が 0 と決まっているノイズ計算は省く
         val = noise.pnoise1(ring_state.lfo_phase, base=ring_state.cc_number * 10)  # -1.0〜1.0の範囲
         val = val + 1  # 0.0〜2.0にシフト
         return ring_state.lfo_amplitude * val  # 振幅が0 < 振幅 < 1.0 になるように補正
@@ -128,7 +135,8 @@ class RandomEaseLfoStyle(BaseLfoStyle):
     EASING_COEFFICIENT: float = 0.1  # 0 < coefficient ≤ 1
     OUTPUT_SCALE: float = 2.0  # 出力値のスケール係数
 
-    # 各CC番号の状態を管理するテーブル
+    # 各CC番号の状態を管理するテーブル。インスタンスではなくクラスに持たせているため、
+    # get_lfo_instance() が同じインスタンスを使い回しても CC 番号ごとに独立した状態が保たれる
     _states: dict[int, dict[str, float]] = {}
 
     @classmethod
@@ -225,9 +233,17 @@ LFO_STYLE_MAP = {
 }
 
 
+# LfoStyle ごとのインスタンスキャッシュ。各スタイルはインスタンス状態を持たないため共有できる
+_LFO_INSTANCES: dict[LfoStyle, BaseLfoStyle] = {}
+
+
 def get_lfo_instance(style: LfoStyle) -> BaseLfoStyle:
+    lfo = _LFO_INSTANCES.get(style)
+    if lfo is not None:
+        return lfo
     cls = LFO_STYLE_MAP.get(style)
     if cls is None:
         LOGGER.warning("Unknown LfoStyle %s – fallback to STATIC", style)
         cls = StaticLfoStyle
-    return cls()
+    lfo = _LFO_INSTANCES[style] = cls()
+    return lfo
@@ -24,12 +24,9 @@ def _require_arc_set(method):
 
 import monome
 
+from arc.enums.enums import LedStyle
 from arc.models.model import LayerState, RingState
-from arc.services.renderers.led_styles import (
-    LED_STYLE_MAP,
-    BaseLedStyle,
-    get_led_instance,
-)
+from arc.services.renderers.led_styles import BaseLedStyle, get_led_instance
 from arc.utils.hardware_spec import ARC_SPEC, ArcSpec
 
 LOGGER = logging.getLogger(__name__)
@@ -57,8 +54,12 @@ class LedRenderer:
         self.arc: Optional[monome.Arc] = None
         self.buffer: Optional[monome.ArcBuffer] = None
         self._styles: dict[int, BaseLedStyle] = {}  # 各リングごとの LED スタイルを保持するキャッシュ
-        self._last_levels: dict[int, list[int]] = {}  # 各リングごとの LED レベルを保持するキャッシュ
+        self._style_enums: dict[int, LedStyle] = {}  # 各スタイルインスタンスを生成したときの LedStyle
+        # 各リングごとに最後に送信した LED レベル。immutable な bytes で保持し、差分判定を memcmp 1 回で済ませる
+        self._last_levels: dict[int, bytes] = {}
         self._render_blocked: bool = False  # LED 描画をブロックするフラグ
+        self._dirty: bool = False  # flush() 未送信のバッファ更新があるか
+        self._zero_levels = bytes(spec.leds_per_ring)  # 消灯状態の LED レベル (all_off() でキャッシュへ書き込む)
 
     def set_arc(self, arc: monome.Arc) -> None:
         """Arc インスタンスと描画バッファを設定する。
@@ -72,23 +73,43 @@ class LedRenderer:
 
     @_require_arc_set
     def all_off(self) -> None:
-        """全ての LED を消灯"""
-        assert self.arc is not None, "mypy: _require_arc_set guarantees self.arc"
+        """全ての LED を消灯する。
+
+        送信は 1 リング 1 回の ``ring_all`` で行い (ArcBuffer.render() は 64 値の
+        ``ring_map`` をリング数分送るため、こちらの方が小さい)、バッファと差分キャッシュも
+        消灯状態に揃える。これにより消灯前と同じ値の再描画がキャッシュで握りつぶされない。
+        """
+        assert self.arc is not None and self.buffer is not None, "mypy: _require_arc_set guarantees attributes"
+        zero_levels = self._zero_levels
         for n in range(self.spec.rings_per_device):
             self.arc.ring_all(n, 0)
+            self.buffer.ring_all(n, 0)
+            self._last_levels[n] = zero_levels
 
     @_require_arc_set
     def highlight(self, ring_idx: int, level: int = 1) -> None:
         """指定したリングの LED を全灯する。他のリングは消灯する。
 
+        ``all_off()`` と同じく、バッファと差分キャッシュも表示内容に揃える。
+
         Args:
             ring_idx (int): 全灯対象リングのインデックス (0‒3)。
             level (int, optional): 点灯させる輝度レベル (0‒15)。デフォルトは 1。
         """
         LOGGER.debug("highlight: ring_idx=%d, level=%d", ring_idx, level)
-        assert self.arc is not None, "mypy: _require_arc_set guarantees self.arc"
-        self.all_off()
+        assert self.arc is not None and self.buffer is not None, "mypy: _require_arc_set guarantees attributes"
+        # all_off() してから点灯すると対象リングへ 2 回送信するため、対象以外だけを消灯する。
+        # all_off() と同様にバッファと差分キャッシュも表示内容に揃え、後続の描画が
+        # ignore_cache に頼らずハイライトを上書きできるようにする
+        zero_levels = self._zero_levels
+        for n in range(self.spec.rings_per_device):
+            if n != ring_idx:
+                self.arc.ring_all(n, 0)
+                self.buffer.ring_all(n, 0)
+                self._last_levels[n] = zero_levels
         self.arc.ring_all(ring_idx, level)
+        self.buffer.ring_all(ring_idx, level)
+        self._last_levels[ring_idx] = bytes((level,)) * self.spec.leds_per_ring
 
     def set_render_block(self, *, blocked: bool = True) -> None:
         """LED 描画をブロック／解除する。
@@ -106,6 +127,19 @@ class LedRenderer:
         else:
             LOGGER.info("LED rendering unblocked")
 
+    def flush(self) -> None:
+        """``render_value()`` でバッファへ書き込まれた更新を 1 回だけ Arc へ送信する。
+
+        バッファが更新されていなければ何も送信しない。Arc 接続前に LFO エンジンが
+        フレームを回しても例外にならないよう、``set_arc()`` の検証は行わない
+        (更新は ``render_value()`` / ``render_layer()`` 経由でしか発生せず、そちらで検証済み)。
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        assert self.arc is not None and self.buffer is not None, "mypy: render_value()/render_layer() guarantee attributes"
+        self.buffer.render(self.arc)
+
     @_require_arc_set
     def render_layer(self, layer: LayerState, *, ignore_cache: bool = False) -> None:
         """LayerState 全体を LED へ描画する。
@@ -123,28 +157,27 @@ class LedRenderer:
         if self._render_blocked:
             return
 
-        updated = False  # 変更があったリングがあれば最後に 1 回だけ render する
-
         for ring_idx, ring_state in enumerate(layer):
             levels = self._build_levels(ring_idx, ring_state)
 
-            prev = self._last_levels.get(ring_idx)
-            if (not ignore_cache) and prev is not None and prev == levels:
+            if (not ignore_cache) and self._last_levels.get(ring_idx) == levels:
                 # 差分が無ければバッファ書き込みも render も不要
                 continue
 
             # 差分があったリングのみバッファへマッピング
             self.buffer.ring_map(ring_idx, levels)
-            self._last_levels[ring_idx] = levels.copy()
-            updated = True
+            self._last_levels[ring_idx] = bytes(levels)
+            self._dirty = True
 
         # いずれかのリングが更新された場合のみ 1 度だけフラッシュ
-        if updated:
-            self.buffer.render(self.arc)
+        self.flush()
 
     @_require_arc_set
     def render_value(self, ring_idx: int, ring_state: RingState, *, ignore_cache: bool = False) -> None:
-        """RingState の値を LED へ描画する。
+        """RingState の値を LED バッファへ書き込む。
+
+        Arc への送信は行わない。複数リングの更新を 1 回の送信にまとめるため、
+        呼び出し側は一連の更新の最後に :py:meth:`flush` を呼ぶこと。
 
         Args:
             ring_idx (int): 描画対象リングのインデックス (0‒3)。
@@ -158,20 +191,18 @@ class LedRenderer:
             return
         levels = self._build_levels(ring_idx, ring_state)
 
-        # 前フレームとの差分チェック ― 同一ならスキップ
-        prev = self._last_levels.get(ring_idx)
-        if (not ignore_cache) and prev is not None and prev == levels:
+        # 前フレームとの差分チェック ― 同一ならスキップ (bytes と bytearray の比較は memcmp 1 回)
+        if (not ignore_cache) and self._last_levels.get(ring_idx) == levels:
             # LOGGER.debug(f"levels unchanged, skip ring {ring_idx}")
             return
 
-        # 変更があったので描画してキャッシュを更新
+        # 変更があったのでバッファへ書き込み、送信は flush() まで遅延する
         self.buffer.ring_map(ring_idx, levels)
-        self.buffer.render(self.arc)
-        # list オブジェクトをそのまま保持すると次フレームで同じ参照が再利用され
-        # 差分検出が効かないため copy() してスナップショット保存
-        self._last_levels[ring_idx] = levels.copy()
+        self._dirty = True
+        # スタイル側の bytearray は次フレームで再利用されるため、immutable な bytes としてコピーを保持する
+        self._last_levels[ring_idx] = bytes(levels)
 
-    def _build_levels(self, ring_idx: int, ring_state: RingState) -> list[int]:
+    def _build_levels(self, ring_idx: int, ring_state: RingState) -> bytearray:
         """RingState から LED 輝度リストを生成し、必要に応じてスタイルを再生成する内部ヘルパ。
 
         Args:
@@ -179,14 +210,17 @@ class LedRenderer:
             ring_state (RingState): 対象リングの状態。
 
         Returns:
-            list[int]: LED 輝度レベルのリスト (長さ 64)。
+            bytearray: LED 輝度レベルの配列 (長さ 64)。
         """
         led_style = self._styles.get(ring_idx)
-        # スタイルが変わった場合は新規インスタンス化
-        if led_style is None or led_style.__class__ is not LED_STYLE_MAP.get(ring_state.led_style):
-            before_style = None if led_style is None else led_style.style_enum
-            LOGGER.info(f"LED style changed, re-instantiating. before={before_style}, after={ring_state.led_style}")
-            led_style = get_led_instance(ring_state.led_style, self.max_brightness)
+        style_enum = ring_state.led_style
+        # スタイルが変わった場合は新規インスタンス化 (定常時は enum の同一性比較のみ)
+        if led_style is None or self._style_enums.get(ring_idx) is not style_enum:
+            LOGGER.info(
+                "LED style changed, re-instantiating. before=%s, after=%s", self._style_enums.get(ring_idx), style_enum
+            )
+            led_style = get_led_instance(style_enum, self.max_brightness)
             self._styles[ring_idx] = led_style
+            self._style_enums[ring_idx] = style_enum
         # レベルリストを生成
         return led_style.build_levels(ring_state.value, ring_state.value_style)
@@ -28,9 +28,19 @@ class BaseLedStyle(ABC):
     def __init__(self, max_brightness: int, spec: ArcSpec = ARC_SPEC):
         self.max_brightness = max_brightness
         self.spec = spec
+        n_leds = spec.leds_per_ring
+        if n_leds <= 0 or n_leds & (n_leds - 1):
+            raise ValueError(f"leds_per_ring must be a power of two, got {n_leds}")
+        # 毎フレーム self.spec.leds_per_ring を 2 段で属性解決しないよう LED 数を保持する
+        self._leds_per_ring: int = n_leds
+        # リング上のインデックスの折り返しは ``% leds_per_ring`` の代わりにこのマスクで行う
+        self._led_mask: int = n_leds - 1
         # 64 要素の輝度配列を一度だけ確保して再利用することで
-        # 毎フレームの GC コストを下げる
-        self._levels: list[int] = [0] * self.spec.leds_per_ring
+        # 毎フレームの GC コストを下げる。bytearray にしておくとレンダラ側の
+        # 差分判定 (bytes との比較) とスナップショット化が C レベルで済む
+        self._levels: bytearray = bytearray(n_leds)
+        # 全消灯用の定数。``levels[:] = self._zeros`` は一時リストを作らず memcpy 1 回で済む
+        self._zeros: bytes = bytes(n_leds)
 
     @classmethod
     @abstractmethod
@@ -39,14 +49,14 @@ class BaseLedStyle(ABC):
 
     # ----------------- public API -----------------
     @abstractmethod
-    def build_levels(self, value: float, style: ValueStyle) -> list[int]:
-        """64 要素 (0‒15) の輝度リストを返す"""
+    def build_levels(self, value: float, style: ValueStyle) -> bytearray:
+        """64 要素 (0‒15) の輝度配列を返す"""
         raise NotImplementedError
 
     # ----------------- helper ---------------------
     def _value_to_norm(self, value: float, style: ValueStyle) -> float:
         """ValueStyle → 0‒1 の正規化値へマップ (小数部保持)"""
-        if style == ValueStyle.INFINITE:
+        if style is ValueStyle.INFINITE:
             norm = value % 1.0
         else:
             norm = value
@@ -55,7 +65,7 @@ class BaseLedStyle(ABC):
     def _value_to_pos(self, value: float, style: ValueStyle) -> int:
         """ValueStyle → 0‒63 位置へマップ (整数)"""
         norm = self._value_to_norm(value, style)
-        return int(norm * (self.spec.leds_per_ring - 1)) % self.spec.leds_per_ring
+        return int(norm * (self._leds_per_ring - 1)) & self._led_mask
 
     # ----------------- meta ---------------------
     def style_enum(self) -> LedStyle:
@@ -76,13 +86,12 @@ class DotStyle(BaseLedStyle):
 
     def __init__(self, max_brightness: int, spec: ArcSpec = ARC_SPEC, tail_decay: float | None = None):
         super().__init__(max_brightness, spec)
-        self._leds_per_ring: int = spec.leds_per_ring
         decay_val = self.TAIL_DECAY if tail_decay is None else tail_decay
         self._decay: float = clamp(decay_val, 0.0, 1.0)
         # 浮動小数階調バッファ (残像用)
         self._levels_f: list[float] = [0.0] * self._leds_per_ring
 
-    def build_levels(self, value: float, style: ValueStyle) -> list[int]:
+    def build_levels(self, value: float, style: ValueStyle) -> bytearray:
         """
         ドットスタイルの LED レベル配列を生成する。
 
@@ -99,7 +108,7 @@ class DotStyle(BaseLedStyle):
             style (ValueStyle): ``value`` のスケール種別。
 
         Returns:
-            list[int]: 長さ 64 の LED 輝度リスト。各要素は
+            bytearray: 長さ 64 の LED 輝度配列。各要素は
             ``0‒max_brightness`` の整数。
         """
         n_leds = self._leds_per_ring
@@ -109,19 +118,25 @@ class DotStyle(BaseLedStyle):
 
         # 1) 既存残像を減衰しつつ整数バッファへ量子化 (1 パス)
         for i, f in enumerate(f_levels):
-            if f > 0.0:
-                f *= decay
-                f_levels[i] = f
-            else:
+            if f == 0.0:
+                levels[i] = 0
+                continue
+            f *= decay
+            if f < 0.5:
+                # 量子化すると 0 になる残像は 0.0 へ丸め、以降のフレームで減衰計算を繰り返さない
                 f_levels[i] = 0.0
-            # 即時量子化して整数バッファを書き戻す
-            levels[i] = clamp(int(round(f_levels[i])), 0, self.max_brightness)
-
-        # 2) 現フレームのドット位置を計算
-        norm = self._value_to_norm(value, style)
+                levels[i] = 0
+                continue
+            f_levels[i] = f
+            # 即時量子化して整数バッファを書き戻す。f は [0.5, max_brightness] に収まるため clamp は不要。
+            # 表示結果を変えないよう丸めは round() (偶数丸め) のまま
+            levels[i] = round(f)
+
+        # 2) 現フレームのドット位置を計算 (_value_to_norm() のインライン展開)
+        norm = value % 1.0 if style is ValueStyle.INFINITE else value
         pos_float = (norm * n_leds) % n_leds
         lower_idx = int(pos_float)  # floor を 1 回で兼用
-        upper_idx = (lower_idx + 1) % n_leds
+        upper_idx = (lower_idx + 1) & self._led_mask
         frac = pos_float - lower_idx
 
         lower_brightness = (1.0 - frac) * self.max_brightness
@@ -130,11 +145,11 @@ class DotStyle(BaseLedStyle):
         # 3) 新しい輝度を浮動小数バッファへマージし直ちに整数へ反映
         if lower_brightness > f_levels[lower_idx]:
             f_levels[lower_idx] = lower_brightness
-            levels[lower_idx] = clamp(int(round(lower_brightness)), 0, self.max_brightness)
+            levels[lower_idx] = round(lower_brightness)  # 0‒max_brightness に収まる
 
         if upper_brightness > f_levels[upper_idx]:
             f_levels[upper_idx] = upper_brightness
-            levels[upper_idx] = clamp(int(round(upper_brightness)), 0, self.max_brightness)
+            levels[upper_idx] = round(upper_brightness)
         return levels
 
 
@@ -147,6 +162,10 @@ class PotentiometerStyle(BaseLedStyle):
     def style(cls) -> LedStyle:
         return LedStyle.POTENTIOMETER
 
+    # (max_brightness, leds_per_ring) ごとのグラデーション表。内容は読み取り専用なので全インスタンスで共有し、
+    # プリセット切替などでスタイルを作り直すたびに数百 µs かかる前計算を繰り返さない
+    _GRADIENT_CACHE: dict[tuple[int, int], list[tuple[tuple[int, int], ...]]] = {}
+
     def __init__(self, max_brightness: int, spec: ArcSpec = ARC_SPEC):
         """
         インスタンスを初期化し、LED40→LED24 の時計回りアークを
@@ -159,10 +178,17 @@ class PotentiometerStyle(BaseLedStyle):
         Note:
             ``_arc_indices`` と ``_arc_length`` を生成してキャッシュすることで、
             毎フレームのリスト構築コストと ``%`` 演算を削減する。
+            さらに先端位置ごとのグラデーションも ``_gradients`` として前計算し、
+            毎フレームの輝度計算を省く (同じ設定のインスタンス間で共有)。
         """
         super().__init__(max_brightness, spec)
         self._arc_indices: list[int] = self._compute_arc_indices()
         self._arc_length: int = len(self._arc_indices)
+        cache_key = (max_brightness, self._leds_per_ring)
+        gradients = self._GRADIENT_CACHE.get(cache_key)
+        if gradients is None:
+            gradients = self._GRADIENT_CACHE[cache_key] = self._compute_gradients()
+        self._gradients: list[tuple[tuple[int, int], ...]] = gradients
 
     def _compute_arc_indices(self) -> list[int]:
         """
@@ -172,16 +198,37 @@ class PotentiometerStyle(BaseLedStyle):
         Returns:
             list[int]: LED インデックスのリスト。長さは 49。
         """
+        mask = self._led_mask
         indices: list[int] = []
         i = 40
         while True:
             indices.append(i)
-            i = (i + 1) % self.spec.leds_per_ring
-            if i == (24 + 1) % self.spec.leds_per_ring:
+            i = (i + 1) & mask
+            if i == (24 + 1) & mask:
                 break
         return indices
 
-    def build_levels(self, value: float, style: ValueStyle) -> list[int]:
+    def _compute_gradients(self) -> list[tuple[tuple[int, int], ...]]:
+        """
+        先端のアーク内位置 (0‒``_arc_length - 1``) ごとに、点灯させる
+        ``(LED インデックス, 輝度)`` の組を前計算する。
+
+        起点 (LED40) は輝度 1、先端は ``max_brightness`` で、その間を線形補間する。
+
+        Returns:
+            list[tuple[tuple[int, int], ...]]: 先端位置をインデックスとするグラデーション表。
+        """
+        gradients: list[tuple[tuple[int, int], ...]] = [((self._arc_indices[0], 1),)]
+        for span in range(1, self._arc_length):
+            gradients.append(
+                tuple(
+                    (self._arc_indices[i], int(round(1.0 + (self.max_brightness - 1.0) * i / span)))
+                    for i in range(span + 1)
+                )
+            )
+        return gradients
+
+    def build_levels(self, value: float, style: ValueStyle) -> bytearray:
         """
         現在値をもとにポテンショメータ風の帯状グラデーションを生成する。
 
@@ -190,23 +237,22 @@ class PotentiometerStyle(BaseLedStyle):
             style (ValueStyle): ``value`` のスケール種別。
 
         Returns:
-            list[int]: 長さ 64 の LED 輝度リスト。起点 (LED40) は輝度 1、
+            bytearray: 長さ 64 の LED 輝度配列。起点 (LED40) は輝度 1、
             先端は ``max_brightness``、その間を線形補間したグラデーション。
         """
         levels = self._levels
-        levels[:] = [0] * self.spec.leds_per_ring  # いったん全消灯
+        levels[:] = self._zeros  # いったん全消灯
 
         # -----------------------------
         # Use the pre‑computed clockwise arc
         # -----------------------------
-        arc_indices = self._arc_indices
         arc_length = self._arc_length
 
         # -----------------------------
         # value を [0,1] に正規化して、arc_indices の途中まで点灯
         # -----------------------------
-        norm = self._value_to_norm(value, style)
-        norm = max(0.0, min(1.0, norm))  # 0～1 にClamp
+        norm = value % 1.0 if style is ValueStyle.INFINITE else value  # _value_to_norm() のインライン展開
+        norm = 0.0 if norm < 0.0 else (1.0 if norm > 1.0 else norm)  # 0～1 にClamp
 
         # (A) 先端=max_brightness, 起点(LED40)=1 で線形グラデーション ---------
         pos_float = norm * (arc_length - 1)  # 0.0→48.0
@@ -216,25 +262,9 @@ class PotentiometerStyle(BaseLedStyle):
         # 先端 LED (lead) は、frac>0 のとき upper、それ以外は lower
         lead_idx_in_arc = lower_idx_in_arc + (1 if frac > 0 else 0)
 
-        # 起点しか点かない (value==0) 場合
-        if lead_idx_in_arc == 0:
-            levels[arc_indices[0]] = 1
-            return levels
-
-        # 起点(1) → 先端(max) へ線形に輝度を一括で計算
-        span = lead_idx_in_arc
-        # Pure Python implementation of linspace
-        if span == 0:
-            brightness_values = [1.0]
-        else:
-            brightness_values = []
-            for i in range(span + 1):
-                brightness = 1.0 + (self.max_brightness - 1.0) * i / span
-                brightness_values.append(brightness)
-        
-        for idx_in_arc, brightness in enumerate(brightness_values):
-            led_i = arc_indices[idx_in_arc]
-            levels[led_i] = int(round(brightness))
+        # 起点(1) → 先端(max) の前計算済みグラデーションを書き込む (value==0 は起点のみ)
+        for led_i, level in self._gradients[lead_idx_in_arc]:
+            levels[led_i] = level
 
         return levels
 
@@ -252,7 +282,7 @@ class BipolarStyle(BaseLedStyle):  # TODO バーの先端を最大光度に
     LEFT_DOWN_IDX = 43  # 240°
     MAX_SPAN = 21  # 0→21 で約 120°
 
-    def build_levels(self, value: float, style: ValueStyle) -> list[int]:
+    def build_levels(self, value: float, style: ValueStyle) -> bytearray:
         """
         バイポーラ表示を生成する。
 
@@ -265,11 +295,10 @@ class BipolarStyle(BaseLedStyle):  # TODO バーの先端を最大光度に
             style (ValueStyle): ``value`` のスケール種別。
 
         Returns:
-            list[int]: 64 要素の輝度リスト。
+            bytearray: 64 要素の輝度配列。
         """
-        n_leds = self.spec.leds_per_ring
         levels = self._levels
-        levels[:] = [0] * n_leds
+        levels[:] = self._zeros
 
         # --- 基本点灯 ----------------------------------------------------
         dim = max(1, self.max_brightness // 4)
@@ -278,8 +307,9 @@ class BipolarStyle(BaseLedStyle):  # TODO バーの先端を最大光度に
         levels[self.RIGHT_DOWN_IDX] = dim
 
         # --- 入力値を -0.5‒+0.5 に正規化 ---------------------------------
-        centered_value = self._value_to_norm(value, style) - 0.5
-        centered_value = max(-0.5, min(0.5, centered_value))
+        norm = value % 1.0 if style is ValueStyle.INFINITE else value  # _value_to_norm() のインライン展開
+        centered_value = norm - 0.5
+        centered_value = -0.5 if centered_value < -0.5 else (0.5 if centered_value > 0.5 else centered_value)
         if centered_value == 0.0:
             return levels
 
@@ -289,8 +319,9 @@ class BipolarStyle(BaseLedStyle):  # TODO バーの先端を最大光度に
             return levels
 
         step_sign = 1 if centered_value > 0 else -1
+        mask = self._led_mask
         for step in range(1, span_steps + 1):
-            idx = (self.CENTER_IDX + step_sign * step) % n_leds
+            idx = (self.CENTER_IDX + step_sign * step) & mask  # 負方向も 2 の補数でそのまま折り返せる
             levels[idx] = dim
 
         return levels
@@ -313,13 +344,25 @@ class PerlinLedStyle(BaseLedStyle):
     BRIGHTNESS_SCALE = 2.0
     BRIGHTNESS_OFFSET = 0.5
 
+    # LED 数ごとの (cos, sin) テーブル。全インスタンスで共有し、スタイル切替時の再計算を省く
+    _TRIG_TABLES: dict[int, tuple[tuple[float, ...], tuple[float, ...]]] = {}
+
     def __init__(self, max_brightness: int = 15) -> None:
         super().__init__(max_brightness)
         self.noise_position = 0.0
         self.noise_seed = random.randint(0, 2**8)
         self.previous_norm = 0.0
-        self._cos_table = [math.cos(math.tau * i / self.spec.leds_per_ring) for i in range(self.spec.leds_per_ring)]
-        self._sin_table = [math.sin(math.tau * i / self.spec.leds_per_ring) for i in range(self.spec.leds_per_ring)]
+        self._cos_table, self._sin_table = self._trig_tables(self._leds_per_ring)
+
+    @classmethod
+    def _trig_tables(cls, n_leds: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+        """LED 位置ごとの cos / sin テーブルを返す (LED 数ごとに 1 度だけ生成)"""
+        tables = cls._TRIG_TABLES.get(n_leds)
+        if tables is None:
+            cos_table = tuple(math.cos(math.tau * i / n_leds) for i in range(n_leds))
+            sin_table = tuple(math.sin(math.tau * i / n_leds) for i in range(n_leds))
+            tables = cls._TRIG_TABLES[n_leds] = (cos_table, sin_table)
+        return tables
 
     # --------------------- private helper ---------------------
     def _update_noise_position(self, norm: float) -> None:
@@ -328,30 +371,32 @@ class PerlinLedStyle(BaseLedStyle):
             self.noise_position += norm * self.MOVE_SPEED + self.NOISE_POSITION_INCREMENT
         self.previous_norm = norm
 
-    def _noise_to_brightness(self, n: float) -> int:
-        """Perlin ノイズ値 (-1..1) を 0‒max にマッピング"""
-        raw = (n * self.BRIGHTNESS_SCALE + self.BRIGHTNESS_OFFSET) * self.max_brightness
-        return clamp(int(raw), 0, self.max_brightness)
-
     # --------------------- public interface -------------------
-    def build_levels(self, value: float, style: ValueStyle) -> list[int]:
+    def build_levels(self, value: float, style: ValueStyle) -> bytearray:
         """64 個の輝度レベルを返すメイン関数"""
-        levels = self._levels
-        levels[:] = [0] * self.spec.leds_per_ring
+        levels = self._levels  # 全 LED を毎回上書きするため事前のゼロクリアは不要
 
-        # ノイズ円半径と走査位置を更新
-        norm = self._value_to_norm(value, style)
+        # ノイズ円半径と走査位置を更新 (_value_to_norm() のインライン展開)
+        norm = value % 1.0 if style is ValueStyle.INFINITE else value
         radius = self.MINIMUM_NOISE_RADIUS + norm * self.NOISE_RADIUS_SCALE
         self._update_noise_position(norm)
 
         # LED ごとに輝度計算 (③ coords 計算をインライン化 + テーブル参照)
+        # 64 回のループ内で属性解決しないよう、関数とテーブルをローカルへ束縛する
         pos = self.noise_position
         y_scale = self.NOISE_POSITION_Y_SCALE * pos
-        for i in range(self.spec.leds_per_ring):
-            nx = radius * self._cos_table[i] + pos
-            ny = radius * self._sin_table[i] + y_scale
-            n = noise.pnoise2(nx, ny, base=self.noise_seed)
-            levels[i] = self._noise_to_brightness(n)
+        pnoise2 = noise.pnoise2
+        seed = self.noise_seed
+        scale = self.BRIGHTNESS_SCALE
+        offset = self.BRIGHTNESS_OFFSET
+        max_b = self.max_brightness
+        for i, (cos_i, sin_i) in enumerate(zip(self._cos_table, self._sin_table)):
+            # base をキーワードで渡すと呼び出しごとに kwargs 辞書が作られるため、既定値を並べて位置引数で渡す
+            # (octaves=1, persistence=0.5, lacunarity=2.0, repeatx=1024, repeaty=1024, base=seed)
+            n = pnoise2(radius * cos_i + pos, radius * sin_i + y_scale, 1, 0.5, 2.0, 1024, 1024, seed)
+            # Perlin ノイズ値 (-1..1) を 0‒max にマッピングしてクランプ
+            level = int((n * scale + offset) * max_b)
+            levels[i] = 0 if level < 0 else (max_b if level > max_b else level)
 
         if pos > 1e4:
             # オーバーフロー防止
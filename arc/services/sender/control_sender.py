@@ -5,18 +5,18 @@ midi_sender
 
 - 7‑bit CC : ``send_cc_7bit()``
 - 14‑bit CC: ``send_cc_14bit()``
+- 7‑bit CC 一括: ``send_cc_bulk()``
 - OSC 送信 : ``AioOscSender``
 """
 
 import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, Callable, Iterable
 
 import aiosc  # type: ignore
 import mido
 
-from arc.utils.util import clamp
-
 LOGGER = logging.getLogger(__name__)
 
 
@@ -26,21 +26,52 @@ class MidiSender:
     引数に指定した名前で **仮想 MIDI‑OUT ポート** を自動生成し、
     `send_cc_7bit()` ／ `send_cc_14bit()` で任意の CC メッセージを送信できる。
 
+    量子化後の値が前回送信と同じ CC は送信しない。14‑bit CC は MSB が変わらなければ
+    LSB のみを送る。ポートを開き直した場合などは ``reset_cc_cache()`` で送信履歴を消去する。
+    ``min_interval_ms`` を指定すると、7‑bit CC で前回送信から間隔内の ±1 の揺れ
+    (エンコーダのノイズ) をすぐには送らず保留する。保留した最新値は間隔の終わりに
+    実行中のイベントループの ``call_later`` で送るため、ノブが止まっても受信側が
+    1 ステップずれたまま残らない。イベントループ外から呼ばれた場合は保留せずに送る。
+
     Args:
         port_name (str): 作成する仮想ポート名。
         channel (int): MIDIチャンネル (1-16)。内部では0-15に変換して使用。
         enabled (bool): MIDI送信を有効にするかどうか。
+        min_interval_ms (float): 隣接値の送信を間引く最小間隔 [ms]。0 で無効 (デフォルト)。
 
     """
 
-    def __init__(self, port_name: str, channel: int = 1, enabled: bool = True) -> None:
+    def __init__(self, port_name: str, channel: int = 1, enabled: bool = True, min_interval_ms: float = 0) -> None:
         self.port_name = port_name
         # MIDIチャンネル: ユーザー向け表記(1-16) → プロトコル値(0-15)に変換
         # 音楽ソフトでは「チャンネル1」と表示されるが、MIDI規格では内部的に0を使用
         self.channel = max(0, min(15, channel - 1))
         self.enabled = enabled
+        self._send: Callable[[mido.Message], None] | None = None  # port.send の束縛メソッド (port 設定時に更新)
         self.port = None
         self.thread = None
+        # (channel, cc_num) ごとに最後に送信した量子化済みの値
+        self._last_cc7: dict[tuple[int, int], int] = {}
+        self._last_cc14: dict[tuple[int, int], int] = {}
+        # 7‑bit CC の隣接値デバウンス。(channel, cc_num) ごとの最終送信時刻 (time.monotonic_ns)
+        self._min_interval_ns = int(min_interval_ms * 1_000_000)
+        self._last_cc7_time: dict[tuple[int, int], int] = {}
+        # 間隔内で保留した最新値と、それを間隔の終わりに送るタイマー
+        self._pending_cc7: dict[tuple[int, int], int] = {}
+        self._pending_cc7_handles: dict[tuple[int, int], asyncio.TimerHandle] = {}
+        # (channel, control) ごとに使い回す CC メッセージ。毎回の mido.Message 生成 (検証込み) を避ける
+        self._cc_messages: dict[tuple[int, int], mido.Message] = {}
+
+    @property
+    def port(self) -> Any:
+        """送信先の mido 出力ポート。未接続なら None。"""
+        return self._port
+
+    @port.setter
+    def port(self, port: Any) -> None:
+        # send_cc_* のたびに self.port.send を引かないよう、束縛メソッドを保持しておく
+        self._port = port
+        self._send = None if port is None else port.send
 
     # ------------------------------------------------------------------
     # Public API
@@ -53,6 +84,7 @@ class MidiSender:
         try:
             mido.set_backend("mido.backends.rtmidi")
             self.port = mido.open_output(self.port_name, virtual=True)  # type: ignore
+            self.reset_cc_cache()
             LOGGER.info("MIDI 送信ポート '%s' を作成", self.port_name)
             return True
         except Exception as e:
@@ -68,29 +100,90 @@ class MidiSender:
         if self.port:
             self.port.close()
             self.port = None
+            self.reset_cc_cache()
             LOGGER.info("MIDI 送信ポートを閉じました")
 
+    def reset_cc_cache(self) -> None:
+        """CC の送信履歴を消去し、次回は値が同じでも必ず送信させる。"""
+        self._last_cc7.clear()
+        self._last_cc14.clear()
+        self._last_cc7_time.clear()
+        self._pending_cc7.clear()
+        for handle in self._pending_cc7_handles.values():
+            handle.cancel()
+        self._pending_cc7_handles.clear()
+
     def send_cc_7bit(self, cc_num: int, value: float, channel: int | None = None) -> None:
-        """7‑bit Control‑Change を送信する。"""
-        if not self.enabled or self.port is None:
+        """7‑bit Control‑Change を送信する。量子化後の値が前回と同じなら送信しない。"""
+        send = self._send
+        if not self.enabled or send is None:
             return
         if channel is None:
             channel = self.channel
-        value = int(clamp(value * 127, 0, 127))
-        LOGGER.debug("MIDI 7‑bit CC → ch=%d cc=%d value=%d", channel, cc_num, value)
-        msg = mido.Message("control_change", channel=channel, control=cc_num, value=value)
-        self.port.send(msg)  # type: ignore
+        self._send_cc_7bit_value(send, channel, cc_num, value)
+
+    def send_cc_bulk(self, updates: Iterable[tuple[int, float]], channel: int | None = None) -> None:
+        """複数の 7‑bit CC をまとめて送信する。
+
+        ``send_cc_7bit()`` を N 回呼ぶのと同じ結果になるが、有効判定・チャンネル解決・
+        メソッド参照をループの外で 1 回だけ行う。前回と同じ量子化値の CC は送らない。
+
+        Args:
+            updates (Iterable[tuple[int, float]]): ``(cc_num, value)`` の列。value は 0.0‒1.0。
+            channel (int | None): 送信チャンネル (0‒15)。None ならデフォルトチャンネル。
+        """
+        send = self._send
+        if not self.enabled or send is None:
+            return
+        if channel is None:
+            channel = self.channel
+        send_value = self._send_cc_7bit_value
+        for cc_num, value in updates:
+            send_value(send, channel, cc_num, value)
+
+    def _send_cc_7bit_value(
+        self, send: Callable[[mido.Message], None], channel: int, cc_num: int, value: float
+    ) -> None:
+        """1 つの 7‑bit CC 値を量子化し、送信履歴とデバウンスを確認して必要なら送る。
+
+        ``send_cc_7bit()`` と ``send_cc_bulk()`` の共通処理。有効判定とチャンネル解決は
+        呼び出し側で済ませ、束縛済みの ``send`` を受け取る。
+        """
+        # clamp() の関数呼び出しを避け、比較だけで 0‒127 に収めて切り捨てる
+        scaled = value * 127
+        level = 0 if scaled <= 0 else (127 if scaled >= 127 else int(scaled))
+        key = (channel, cc_num)
+        prev = self._last_cc7.get(key)
+        if prev == level:
+            if self._pending_cc7:
+                self._pending_cc7.pop(key, None)  # 揺れが送信済みの値へ戻ったので保留値は不要
+            return
+        if self._min_interval_ns and self._debounced(key, level, prev):
+            return
+        self._last_cc7[key] = level
+        LOGGER.debug("MIDI 7‑bit CC → ch=%d cc=%d value=%d", channel, cc_num, level)
+        send(self._cc_message(channel, cc_num, level))
 
     def send_cc_14bit(self, cc_num: int, value: float, channel: int | None = None) -> None:
         """14‑bit Control‑Change を MSB/LSB のペアで送信する。
 
         *MSB* = ``cc_num``, *LSB* = ``cc_num + 32`` という MIDI 1.0 の標準に従う。
+        量子化後の値が前回と同じなら何も送らず、MSB が変わらない微小な変化では
+        LSB のみを送る。MSB を送る場合は受信側が LSB をリセットしても値が崩れないよう、
+        常に続けて LSB も送る。
         """
-        if not self.enabled or self.port is None:
+        send = self._send
+        if not self.enabled or send is None:
             return
         if channel is None:
             channel = self.channel
-        value = int(clamp(value * 16383, 0, 16383))
+        scaled = value * 16383
+        value = 0 if scaled <= 0 else (16383 if scaled >= 16383 else int(scaled))
+        key = (channel, cc_num)
+        prev = self._last_cc14.get(key)
+        if prev == value:
+            return
+        self._last_cc14[key] = value
         msb = (value >> 7) & 0x7F
         lsb = value & 0x7F
         LOGGER.debug(
@@ -101,10 +194,65 @@ class MidiSender:
             msb,
             lsb,
         )
-        msg_msb = mido.Message("control_change", channel=channel, control=cc_num, value=msb)
-        msg_lsb = mido.Message("control_change", channel=channel, control=cc_num + 32, value=lsb)
-        self.port.send(msg_msb)  # type: ignore
-        self.port.send(msg_lsb)  # type: ignore
+        if prev is None or (prev >> 7) != msb:
+            send(self._cc_message(channel, cc_num, msb))
+        send(self._cc_message(channel, cc_num + 32, lsb))
+
+    def _debounced(self, key: tuple[int, int], value: int, prev: int | None) -> bool:
+        """前回送信値 ``prev`` との差が ±1 で、前回送信から ``min_interval_ms`` 未満なら保留して True。
+
+        保留した値は間隔の終わりに :py:meth:`_flush_pending_cc7` で送る。イベントループが
+        動いていなければタイマーを張れないため、保留せずに False を返す。
+        送信する場合 (False を返す場合) は送信時刻を更新し、保留値を破棄する。
+        """
+        now = time.monotonic_ns()
+        if prev is not None and -1 <= value - prev <= 1:
+            remaining = self._last_cc7_time[key] + self._min_interval_ns - now
+            if remaining > 0 and self._schedule_pending_cc7(key, remaining):
+                self._pending_cc7[key] = value
+                return True
+        self._pending_cc7.pop(key, None)
+        self._last_cc7_time[key] = now
+        return False
+
+    def _schedule_pending_cc7(self, key: tuple[int, int], remaining_ns: int) -> bool:
+        """保留値を送るタイマーを張る (張り済みなら何もしない)。張れなければ False を返す。"""
+        if key in self._pending_cc7_handles:
+            return True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._pending_cc7_handles[key] = loop.call_later(remaining_ns / 1e9, self._flush_pending_cc7, key)
+        return True
+
+    def _flush_pending_cc7(self, key: tuple[int, int]) -> None:
+        """間隔の終わりに、保留していた最新の 7‑bit CC 値を送信する。"""
+        self._pending_cc7_handles.pop(key, None)
+        value = self._pending_cc7.pop(key, None)
+        send = self._send
+        if value is None or not self.enabled or send is None:
+            return
+        channel, cc_num = key
+        self._last_cc7[key] = value
+        self._last_cc7_time[key] = time.monotonic_ns()
+        LOGGER.debug("MIDI 7‑bit CC → ch=%d cc=%d value=%d (trailing)", channel, cc_num, value)
+        send(self._cc_message(channel, cc_num, value))
+
+    def _cc_message(self, channel: int, control: int, value: int) -> mido.Message:
+        """(channel, control) ごとにキャッシュした CC メッセージの値を書き換えて返す。
+
+        ポートは ``send()`` 内で同期的にバイト列へ変換して送出するため、
+        送信後に同じインスタンスを書き換えても問題ない。
+        """
+        key = (channel, control)
+        msg = self._cc_messages.get(key)
+        if msg is None:
+            msg = mido.Message("control_change", channel=channel, control=control, value=value)
+            self._cc_messages[key] = msg
+        else:
+            msg.value = value
+        return msg
 
 
 # ----------------------------------------------------------------------
@@ -199,15 +347,16 @@ class AiOscSender:
         LOGGER.debug("OSC 送信: %s = %d", address, value)
 
     def send_bundle(self, bundle: list[tuple[str, Any]]) -> None:
-        """複数メッセージをまとめて送信するユーティリティ。
+        """複数メッセージを 1 つの OSC バンドル (``#bundle``、即時実行タイムタグ) として送信する。
+
+        メッセージごとに ``sendto`` するのではなく、1 つの UDP データグラムにまとめて送る。
 
         Args:
             bundle: (address, value) のペア列。
         """
         if not self.enabled or self._protocol is None:
             return
-        for addr, val in bundle:
-            self._protocol.send(addr, val)
+        self._protocol.send_bundle(bundle)
         LOGGER.debug("OSC バンドル送信: %s", bundle)
 
     def close(self) -> None:
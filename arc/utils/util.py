@@ -25,8 +25,12 @@ def fmt(v: Any) -> str:
 
     Returns:
         str: 整形後の文字列。
+
+    Note:
+        ``isinstance`` の型階層探索を避け ``type(v) is float`` の同一性比較で判定する。
+        そのため ``float`` のサブクラスは ``str()`` で整形される。
     """
-    return f"{v:.3f}" if isinstance(v, float) else str(v)
+    return f"{v:.3f}" if type(v) is float else str(v)
 
 
 _T = TypeVar("_T", int, float)
@@ -24,28 +24,43 @@ from arc.modes.preset_select_mode import PresetSelectMode
 from arc.modes.disconnect_mode import DisconnectMode
 
 
+@pytest.fixture(scope="session")
+def _mode_specs():
+    """spec 付きモックモードのテンプレート (spec の解析はセッションで 1 回だけ行う)"""
+    # 型ヒント警告を回避するため、適切にspecを設定
+    return {
+        Mode.READY_MODE: Mock(spec=ReadyMode),
+        Mode.VALUE_SEND_MODE: Mock(spec=ValueSendMode),
+        Mode.LAYER_SELECT_MODE: Mock(spec=LayerSelectMode),
+        Mode.PRESET_SELECT_MODE: Mock(spec=PresetSelectMode),
+        Mode.DISCONNECT_MODE: Mock(spec=DisconnectMode),
+    }
+
+
+@pytest.fixture
+def mock_modes(_mode_specs):
+    """モックモードのフィクスチャ
+
+    テンプレートの呼び出し履歴をリセットして使い回す。テスト側でモードを差し替えても
+    テンプレートに影響しないよう、マッピングの dict だけは毎回新しく作る。
+    """
+    for mode in _mode_specs.values():
+        mode.reset_mock()
+    return dict(_mode_specs)
+
+
+@pytest.fixture(autouse=True)
+def mock_loop(monkeypatch):
+    """``asyncio.get_running_loop()`` が返すモックループ (call_later はモックのタイマーを返す)"""
+    loop = Mock()
+    loop.call_later = Mock(return_value=Mock())
+    monkeypatch.setattr("asyncio.get_running_loop", lambda: loop)
+    return loop
+
+
 class TestController:
     """Controllerの基本機能テスト"""
 
-    @pytest.fixture
-    def mock_modes(self):
-        """モックモードのフィクスチャ"""
-        # 型ヒント警告を回避するため、適切にspecを設定
-        ready_mode = Mock(spec=ReadyMode)
-        value_send_mode = Mock(spec=ValueSendMode)
-        layer_select_mode = Mock(spec=LayerSelectMode)
-        preset_select_mode = Mock(spec=PresetSelectMode)
-        disconnect_mode = Mock(spec=DisconnectMode)
-        
-        # 型ヒント問題を回避するためのマッピング
-        return {
-            Mode.READY_MODE: ready_mode,
-            Mode.VALUE_SEND_MODE: value_send_mode,
-            Mode.LAYER_SELECT_MODE: layer_select_mode,
-            Mode.PRESET_SELECT_MODE: preset_select_mode,
-            Mode.DISCONNECT_MODE: disconnect_mode,
-        }
-
     @pytest.fixture
     def controller(self, mock_modes):
         """テスト用コントローラのフィクスチャ"""
@@ -84,55 +99,43 @@ class TestController:
 
     def test_key_press_triggers_state_transition(self, controller):
         """キー押下でレイヤー選択モードに遷移することを確認"""
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_loop.return_value.call_later = Mock()
-            controller.on_arc_key(0, True)
-            assert controller.state == Mode.LAYER_SELECT_MODE
+        controller.on_arc_key(0, True)
+        assert controller.state == Mode.LAYER_SELECT_MODE
 
     def test_key_release_returns_to_value_send(self, controller):
         """キー離上で値送信モードに戻ることを確認"""
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_timer = Mock()
-            mock_loop.return_value.call_later = Mock(return_value=mock_timer)
-            controller.on_arc_key(0, True)  # まずレイヤー選択モードへ
-            controller.on_arc_key(0, False)  # 離して値送信モードへ
-            assert controller.state == Mode.VALUE_SEND_MODE
+        controller.on_arc_key(0, True)  # まずレイヤー選択モードへ
+        controller.on_arc_key(0, False)  # 離して値送信モードへ
+        assert controller.state == Mode.VALUE_SEND_MODE
 
-    @pytest.mark.asyncio
-    async def test_long_press_detection(self, controller):
+    def test_long_press_detection(self, controller, mock_loop):
         """長押しが正しく検出されることを確認"""
-        # イベントループのコンテキストで実行
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_timer = Mock()
-            mock_loop.return_value.call_later = Mock(return_value=mock_timer)
-            
-            # 押下してレイヤー選択モードへ
-            controller.on_arc_key(0, True)
-            assert controller.state == Mode.LAYER_SELECT_MODE
-            
-            # call_laterが呼ばれたことを確認
-            mock_loop.return_value.call_later.assert_called_once_with(
-                0.2, controller._on_long_press
-            )
-            
-            # 長押しコールバックを手動で実行
-            controller._on_long_press()
-            assert controller.state == Mode.PRESET_SELECT_MODE
-
-    def test_long_press_timer_cancelled_on_release(self, controller):
+        # await は行わないため、モックループだけで十分 (実イベントループは不要)
+        # 押下してレイヤー選択モードへ
+        controller.on_arc_key(0, True)
+        assert controller.state == Mode.LAYER_SELECT_MODE
+        
+        # call_laterが呼ばれたことを確認
+        mock_loop.call_later.assert_called_once_with(
+            0.2, controller._on_long_press
+        )
+        
+        # 長押しコールバックを手動で実行
+        controller._on_long_press()
+        assert controller.state == Mode.PRESET_SELECT_MODE
+
+    def test_long_press_timer_cancelled_on_release(self, controller, mock_loop):
         """離上時に長押しタイマーがキャンセルされることを確認"""
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_timer = Mock()
-            mock_loop.return_value.call_later = Mock(return_value=mock_timer)
-            
-            # 押下
-            controller.on_arc_key(0, True)
-            assert controller._long_press_timer == mock_timer
-            
-            # 離上
-            controller.on_arc_key(0, False)
-            mock_timer.cancel.assert_called_once()
-            assert controller._long_press_timer is None
+        mock_timer = mock_loop.call_later.return_value
+        
+        # 押下
+        controller.on_arc_key(0, True)
+        assert controller._long_press_timer == mock_timer
+        
+        # 離上
+        controller.on_arc_key(0, False)
+        mock_timer.cancel.assert_called_once()
+        assert controller._long_press_timer is None
 
     def test_on_arc_delta_delegates_to_current_mode(self, controller, mock_modes):
         """ダイヤルイベントが現在のモードに委譲されることを確認"""
@@ -141,11 +144,54 @@ class TestController:
         mock_modes[Mode.VALUE_SEND_MODE].on_arc_delta.assert_called_once_with(1, 10)
         
         # レイヤー選択モードに切り替えてダイヤル操作
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_loop.return_value.call_later = Mock()
-            controller.on_arc_key(0, True)
-            controller.on_arc_delta(2, -5)
-            mock_modes[Mode.LAYER_SELECT_MODE].on_arc_delta.assert_called_once_with(2, -5)
+        controller.on_arc_key(0, True)
+        controller.on_arc_delta(2, -5)
+        mock_modes[Mode.LAYER_SELECT_MODE].on_arc_delta.assert_called_once_with(2, -5)
+
+    def test_on_arc_delta_ignores_zero_delta(self, controller, mock_modes):
+        """変化量 0 のダイヤルイベントはモードへ委譲されないことを確認"""
+        controller.on_arc_delta(1, 0)
+        mock_modes[Mode.VALUE_SEND_MODE].on_arc_delta.assert_not_called()
+
+    def test_on_arc_delta_coalesces_per_ring(self, mock_modes, mock_loop):
+        """合算間隔が正の場合、Δ がリングごとに合算されて 1 回だけ委譲されることを確認"""
+        controller = Controller(model=Mock(spec=Model), mode_mapping=mock_modes, delta_coalesce_interval=0.01)
+        controller.on_arc_delta(1, 3)
+        controller.on_arc_delta(1, 4)
+        controller.on_arc_delta(2, -1)
+
+        # タイマーは最初の Δ で 1 度だけ予約される
+        mock_loop.call_later.assert_called_once_with(0.01, controller._flush_deltas)
+        mock_modes[Mode.VALUE_SEND_MODE].on_arc_delta.assert_not_called()
+
+        controller._flush_deltas()
+
+        handler = mock_modes[Mode.VALUE_SEND_MODE].on_arc_delta
+        assert handler.call_count == 2
+        handler.assert_any_call(1, 7)
+        handler.assert_any_call(2, -1)
+        assert controller._pending_deltas == [0, 0, 0, 0]
+        assert controller._delta_flush_handle is None
+
+    def test_pending_deltas_flushed_before_key_transition(self, mock_modes):
+        """キー押下で遷移する前に、合算待ちの Δ が遷移前のモードへ届くことを確認"""
+        controller = Controller(model=Mock(spec=Model), mode_mapping=mock_modes, delta_coalesce_interval=0.01)
+        controller.on_arc_delta(0, 5)
+        controller.on_arc_key(0, True)
+
+        mock_modes[Mode.VALUE_SEND_MODE].on_arc_delta.assert_called_once_with(0, 5)
+        mock_modes[Mode.LAYER_SELECT_MODE].on_arc_delta.assert_not_called()
+
+    def test_on_arc_delta_skips_noop_mode(self, mock_modes):
+        """on_arc_delta をオーバーライドしていないモードへは委譲もエラーログも行わないことを確認"""
+        mock_modes[Mode.DISCONNECT_MODE] = DisconnectMode(lfo_engine=Mock())
+        controller = Controller(model=Mock(spec=Model), mode_mapping=mock_modes)
+        controller.state = Mode.DISCONNECT_MODE
+
+        assert controller._delta_handlers[Mode.DISCONNECT_MODE] is None
+        with patch('arc.controller.controller.LOGGER') as mock_logger:
+            controller.on_arc_delta(0, 10)
+            mock_logger.error.assert_not_called()
 
     def test_on_arc_delta_with_none_state(self, controller):
         """状態がNoneの場合のダイヤルイベント処理を確認"""
@@ -184,90 +230,49 @@ class TestController:
 
     def test_state_enter_exit_callbacks(self, controller, mock_modes):
         """状態遷移時のenter/exitコールバックが呼ばれることを確認"""
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_timer = Mock()
-            mock_loop.return_value.call_later = Mock(return_value=mock_timer)
-            
-            # レイヤー選択モードへの遷移
-            controller.on_arc_key(0, True)
-            mock_modes[Mode.LAYER_SELECT_MODE].on_enter.assert_called_once()
-            
-            # プリセット選択モードへの遷移（レイヤー選択モードから）
-            controller._on_long_press()
-            mock_modes[Mode.LAYER_SELECT_MODE].on_exit.assert_called_once()
-            mock_modes[Mode.PRESET_SELECT_MODE].on_enter.assert_called_once()
-            
-            # 値送信モードへ戻る
-            controller.on_arc_key(0, False)
-            mock_modes[Mode.PRESET_SELECT_MODE].on_exit.assert_called_once()
+        # レイヤー選択モードへの遷移
+        controller.on_arc_key(0, True)
+        mock_modes[Mode.LAYER_SELECT_MODE].on_enter.assert_called_once()
+        
+        # プリセット選択モードへの遷移（レイヤー選択モードから）
+        controller._on_long_press()
+        mock_modes[Mode.LAYER_SELECT_MODE].on_exit.assert_called_once()
+        mock_modes[Mode.PRESET_SELECT_MODE].on_enter.assert_called_once()
+        
+        # 値送信モードへ戻る
+        controller.on_arc_key(0, False)
+        mock_modes[Mode.PRESET_SELECT_MODE].on_exit.assert_called_once()
 
     def test_multiple_key_presses(self, controller):
         """複数回のキー押下が正しく処理されることを確認"""
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_timer = Mock()
-            mock_loop.return_value.call_later = Mock(return_value=mock_timer)
-            
-            # 押下→離上を繰り返す
-            for _ in range(3):
-                controller.on_arc_key(0, True)
-                assert controller.state == Mode.LAYER_SELECT_MODE
-                controller.on_arc_key(0, False)
-                assert controller.state == Mode.VALUE_SEND_MODE
-
-    def test_custom_long_press_duration(self):
+        # 押下→離上を繰り返す
+        for _ in range(3):
+            controller.on_arc_key(0, True)
+            assert controller.state == Mode.LAYER_SELECT_MODE
+            controller.on_arc_key(0, False)
+            assert controller.state == Mode.VALUE_SEND_MODE
+
+    def test_custom_long_press_duration(self, mock_modes, mock_loop):
         """カスタム長押し時間が正しく使用されることを確認"""
         model = Mock(spec=Model)
+        controller = Controller(model=model, mode_mapping=mock_modes, long_press_duration=0.5)  # type: ignore[arg-type]
         
-        # 型ヒント警告を回避するため、適切にspecを設定
-        ready_mode = Mock(spec=ReadyMode)
-        value_send_mode = Mock(spec=ValueSendMode)
-        layer_select_mode = Mock(spec=LayerSelectMode)
-        preset_select_mode = Mock(spec=PresetSelectMode)
-        disconnect_mode = Mock(spec=DisconnectMode)
-        
-        modes = {
-            Mode.READY_MODE: ready_mode,
-            Mode.VALUE_SEND_MODE: value_send_mode,
-            Mode.LAYER_SELECT_MODE: layer_select_mode,
-            Mode.PRESET_SELECT_MODE: preset_select_mode,
-            Mode.DISCONNECT_MODE: disconnect_mode,
-        }
-        controller = Controller(model=model, mode_mapping=modes, long_press_duration=0.5)  # type: ignore[arg-type]
+        controller._start_long_press_timer()
         
-        with patch('asyncio.get_running_loop') as mock_loop:
-            mock_loop.return_value.call_later = Mock()
-            
-            controller._start_long_press_timer()
-            
-            # 0.5秒でcall_laterが呼ばれることを確認
-            mock_loop.return_value.call_later.assert_called_once_with(
-                0.5, controller._on_long_press
-            )
+        # 0.5秒でcall_laterが呼ばれることを確認
+        mock_loop.call_later.assert_called_once_with(
+            0.5, controller._on_long_press
+        )
 
 
 class TestControllerStateTransitions:
     """状態遷移の詳細なテスト"""
 
     @pytest.fixture
-    def controller(self):
+    def controller(self, mock_modes):
         """シンプルなコントローラのフィクスチャ"""
         model = Mock(spec=Model)
-        
-        # 型ヒント警告を回避するため、適切にspecを設定
-        ready_mode = Mock(spec=ReadyMode)
-        value_send_mode = Mock(spec=ValueSendMode)
-        layer_select_mode = Mock(spec=LayerSelectMode)
-        preset_select_mode = Mock(spec=PresetSelectMode)
-        disconnect_mode = Mock(spec=DisconnectMode)
-        
-        modes = {
-            Mode.READY_MODE: ready_mode,
-            Mode.VALUE_SEND_MODE: value_send_mode,
-            Mode.LAYER_SELECT_MODE: layer_select_mode,
-            Mode.PRESET_SELECT_MODE: preset_select_mode,
-            Mode.DISCONNECT_MODE: disconnect_mode,
-        }
-        return Controller(model=model, mode_mapping=modes)  # type: ignore[arg-type]
+        return Controller(model=model, mode_mapping=mock_modes)  # type: ignore[arg-type]
 
     def test_all_state_transitions(self, controller):
         """すべての状態遷移パスをテスト"""
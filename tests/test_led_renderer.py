@@ -17,6 +17,33 @@ from arc.enums.enums import LedStyle, ValueStyle
 from arc.utils.hardware_spec import ARC_SPEC
 
 
+@pytest.fixture(scope="module")
+def _shared_renderer():
+    """set_arc() 済みの LedRenderer と Arc のモック、実バッファ (モジュールで 1 回だけ生成)"""
+    renderer = LedRenderer(max_brightness=10)
+    mock_arc = Mock()
+    renderer.set_arc(mock_arc)
+    return renderer, mock_arc, renderer.buffer
+
+
+@pytest.fixture
+def renderer_and_arc(_shared_renderer):
+    """共有レンダラを初期状態に戻して (renderer, mock_arc) を返すフィクスチャ"""
+    renderer, mock_arc, buffer = _shared_renderer
+    mock_arc.reset_mock()
+    # テストがバッファをモックに差し替えても、次のテストでは実バッファへ戻す
+    renderer.arc = mock_arc
+    renderer.buffer = buffer
+    for n in range(renderer.spec.rings_per_device):
+        buffer.ring_all(n, 0)
+    renderer._styles.clear()
+    renderer._style_enums.clear()
+    renderer._last_levels.clear()
+    renderer._dirty = False
+    renderer.set_render_block(blocked=False)
+    return renderer, mock_arc
+
+
 class TestLedRenderer:
     """LedRenderer の基本機能テスト"""
 
@@ -48,11 +75,9 @@ class TestLedRenderer:
         with pytest.raises(RuntimeError, match="call set_arc"):
             renderer.all_off()
 
-    def test_all_off(self):
+    def test_all_off(self, renderer_and_arc):
         """全LED消灯機能"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
-        renderer.set_arc(mock_arc)
+        renderer, mock_arc = renderer_and_arc
         
         renderer.all_off()
         
@@ -61,17 +86,47 @@ class TestLedRenderer:
         for i in range(4):
             mock_arc.ring_all.assert_any_call(i, 0)
 
-    def test_highlight(self):
+    def test_all_off_resets_cache(self, renderer_and_arc):
+        """消灯後は直前と同じ値でも再描画されることを確認"""
+        renderer, mock_arc = renderer_and_arc
+        ring_state = RingState(value=0.5, led_style=LedStyle.POTENTIOMETER, value_style=ValueStyle.LINEAR)
+
+        renderer.render_value(0, ring_state)
+        renderer.flush()
+        renderer.all_off()
+        mock_arc.reset_mock()
+
+        renderer.render_value(0, ring_state)
+        renderer.flush()
+
+        assert mock_arc.ring_map.called
+
+    def test_highlight(self, renderer_and_arc):
         """特定リングのハイライト機能"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
-        renderer.set_arc(mock_arc)
+        renderer, mock_arc = renderer_and_arc
         
         renderer.highlight(ring_idx=2, level=5)
         
-        # まず全消灯してから指定リングを点灯
-        assert mock_arc.ring_all.call_count == 5  # 4 (all_off) + 1 (highlight)
+        # 対象以外のリングを消灯してから指定リングを点灯 (1 リング 1 パケット)
+        assert mock_arc.ring_all.call_count == 4  # 3 (消灯) + 1 (highlight)
         mock_arc.ring_all.assert_called_with(2, 5)
+        assert (2, 0) not in [c.args for c in mock_arc.ring_all.call_args_list]
+
+    def test_highlight_syncs_cache(self, renderer_and_arc):
+        """ハイライト後は ignore_cache なしの描画でもハイライトが上書きされることを確認"""
+        renderer, mock_arc = renderer_and_arc
+        layer = LayerState([RingState(value=0.5, led_style=LedStyle.POTENTIOMETER) for _ in range(4)])
+        renderer.render_layer(layer)
+
+        renderer.highlight(ring_idx=1, level=5)
+        assert renderer._last_levels[1] == bytes([5]) * 64
+        assert renderer._last_levels[0] == bytes(64)
+
+        mock_buffer = Mock()
+        renderer.buffer = mock_buffer
+        renderer.render_layer(layer)
+        assert mock_buffer.ring_map.call_count == 4  # 全リングがバッファへ書き直される
+        mock_buffer.render.assert_called_once_with(mock_arc)
 
     def test_render_block(self):
         """レンダリングブロック機能"""
@@ -89,12 +144,10 @@ class TestLedRenderer:
         renderer.set_render_block(blocked=False)
         assert renderer._render_blocked is False
 
-    def test_render_value_with_cache(self):
+    def test_render_value_with_cache(self, renderer_and_arc):
         """キャッシュ機構を含むレンダリングテスト"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
+        renderer, mock_arc = renderer_and_arc
         mock_buffer = Mock()
-        renderer.set_arc(mock_arc)
         renderer.buffer = mock_buffer
         
         ring_state = RingState(
@@ -105,26 +158,27 @@ class TestLedRenderer:
         
         # 初回レンダリング
         renderer.render_value(0, ring_state)
+        renderer.flush()
         assert mock_buffer.ring_map.call_count == 1
         assert mock_buffer.render.call_count == 1
         
         # 同じ状態で再レンダリング（キャッシュヒット）
         renderer.render_value(0, ring_state)
+        renderer.flush()
         assert mock_buffer.ring_map.call_count == 1  # 変化なし
         assert mock_buffer.render.call_count == 1    # 変化なし
         
         # 値を変更して再レンダリング
         ring_state.value = 0.7
         renderer.render_value(0, ring_state)
+        renderer.flush()
         assert mock_buffer.ring_map.call_count == 2
         assert mock_buffer.render.call_count == 2
 
-    def test_render_value_ignore_cache(self):
+    def test_render_value_ignore_cache(self, renderer_and_arc):
         """ignore_cache パラメータのテスト"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
+        renderer, mock_arc = renderer_and_arc
         mock_buffer = Mock()
-        renderer.set_arc(mock_arc)
         renderer.buffer = mock_buffer
         
         ring_state = RingState(
@@ -135,17 +189,17 @@ class TestLedRenderer:
         
         # 初回レンダリング
         renderer.render_value(0, ring_state)
+        renderer.flush()
         
         # ignore_cache=True で強制レンダリング
         renderer.render_value(0, ring_state, ignore_cache=True)
+        renderer.flush()
         assert mock_buffer.render.call_count == 2
 
-    def test_render_blocked(self):
+    def test_render_blocked(self, renderer_and_arc):
         """レンダリングブロック時の動作"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
+        renderer, mock_arc = renderer_and_arc
         mock_buffer = Mock()
-        renderer.set_arc(mock_arc)
         renderer.buffer = mock_buffer
         renderer.set_render_block(blocked=True)
         
@@ -153,14 +207,33 @@ class TestLedRenderer:
         
         # ブロック中はレンダリングされない
         renderer.render_value(0, ring_state)
+        renderer.flush()
         assert mock_buffer.render.call_count == 0
 
-    def test_render_layer(self):
+    def test_render_value_batched_until_flush(self, renderer_and_arc):
+        """render_value は送信せず、flush で更新分が 1 回だけ送信されることを確認"""
+        renderer, mock_arc = renderer_and_arc
+        mock_buffer = Mock()
+        renderer.buffer = mock_buffer
+
+        renderer.render_value(0, RingState(value=0.25, led_style=LedStyle.POTENTIOMETER))
+        renderer.render_value(1, RingState(value=0.75, led_style=LedStyle.POTENTIOMETER))
+
+        assert mock_buffer.ring_map.call_count == 2
+        mock_buffer.render.assert_not_called()
+
+        renderer.flush()
+        mock_buffer.render.assert_called_once_with(mock_arc)
+
+        # 更新がなければ送信しない
+        mock_buffer.reset_mock()
+        renderer.flush()
+        mock_buffer.render.assert_not_called()
+
+    def test_render_layer(self, renderer_and_arc):
         """レイヤー全体のレンダリング"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
+        renderer, mock_arc = renderer_and_arc
         mock_buffer = Mock()
-        renderer.set_arc(mock_arc)
         renderer.buffer = mock_buffer
         
         # 4つのリングを持つレイヤー
@@ -177,12 +250,10 @@ class TestLedRenderer:
         assert mock_buffer.ring_map.call_count == 4
         assert mock_buffer.render.call_count == 1
 
-    def test_render_layer_partial_update(self):
+    def test_render_layer_partial_update(self, renderer_and_arc):
         """レイヤーの部分更新（キャッシュ効果）"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
+        renderer, mock_arc = renderer_and_arc
         mock_buffer = Mock()
-        renderer.set_arc(mock_arc)
         renderer.buffer = mock_buffer
         
         layer = LayerState([
@@ -204,11 +275,9 @@ class TestLedRenderer:
         assert mock_buffer.ring_map.call_count == 1
         assert mock_buffer.render.call_count == 1
 
-    def test_style_change_detection(self):
+    def test_style_change_detection(self, renderer_and_arc):
         """LEDスタイル変更の検出と再インスタンス化"""
-        renderer = LedRenderer(max_brightness=10)
-        mock_arc = Mock()
-        renderer.set_arc(mock_arc)
+        renderer, mock_arc = renderer_and_arc
         renderer.buffer = Mock()
         
         ring_state = RingState(
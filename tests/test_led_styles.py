@@ -1,5 +1,7 @@
 """Tests for LED style classes in arc.services.renderers.led_styles."""
 
+import pytest
+
 from arc.services.renderers.led_styles import (
     BipolarStyle,
     DotStyle,
@@ -10,6 +12,7 @@ from arc.services.renderers.led_styles import (
 )
 
 from arc.enums.enums import LedStyle, ValueStyle
+from arc.utils.hardware_spec import ArcSpec
 
 MAX_BRIGHTNESS = 10  # Match the value used in config.yaml
 
@@ -29,6 +32,32 @@ def test_dotstyle_interpolation_half_brightness():
     assert set(lit_indices) == {16, 17}
 
 
+def test_dotstyle_tail_snaps_to_zero():
+    """DotStyle: a decayed tail that quantizes to 0 is dropped from the float buffer."""
+    style = DotStyle(max_brightness=MAX_BRIGHTNESS, tail_decay=0.5)
+    style.build_levels(0.0, ValueStyle.LINEAR)
+
+    for _ in range(10):
+        levels = style.build_levels(0.5, ValueStyle.LINEAR)
+
+    assert levels[0] == 0
+    assert style._levels_f[0] == 0.0
+
+
+def test_dotstyle_rounds_half_to_even():
+    """DotStyle: exact .5 brightness values use round() (half to even), matching the original output."""
+    # max_brightness=5 and a dot halfway between LED0 and LED1 give 2.5 on both -> 2
+    style = DotStyle(max_brightness=5, tail_decay=0.0)
+    levels = style.build_levels(0.5 / 64, ValueStyle.LINEAR)
+    assert (levels[0], levels[1]) == (2, 2)
+
+    # A decayed tail of exactly 2.5 also rounds to 2
+    style = DotStyle(max_brightness=5, tail_decay=0.5)
+    style.build_levels(0.0, ValueStyle.LINEAR)  # LED0 = 5.0
+    levels = style.build_levels(0.5, ValueStyle.LINEAR)  # LED0 decays to 2.5
+    assert levels[0] == 2
+
+
 def test_potentiometer_zero_and_full_scale():
     """PotentiometerStyle: edge cases at 0.0 and 1.0."""
     style = PotentiometerStyle(max_brightness=MAX_BRIGHTNESS)
@@ -49,6 +78,18 @@ def test_potentiometer_zero_and_full_scale():
     assert all(x <= y for x, y in zip(brightness_values, brightness_values[1:]))
 
 
+def test_potentiometer_gradients_shared_between_instances():
+    """PotentiometerStyle: instances with the same settings share one gradient table."""
+    first = PotentiometerStyle(max_brightness=MAX_BRIGHTNESS)
+    second = PotentiometerStyle(max_brightness=MAX_BRIGHTNESS)
+    other = PotentiometerStyle(max_brightness=MAX_BRIGHTNESS - 1)
+
+    assert first._gradients is second._gradients
+    assert other._gradients is not first._gradients
+    # Scratch buffers stay per instance.
+    assert first._levels is not second._levels
+
+
 def test_bipolar_span_positive_and_negative():
     """BipolarStyle: span reaches correct ends and uses expected dim level."""
     style = BipolarStyle(max_brightness=MAX_BRIGHTNESS)
@@ -129,3 +170,9 @@ def test_style_classmethod():
         
         # style_enum() should use the class's style() method
         assert instance.style_enum() == instance.__class__.style()
+
+
+def test_non_power_of_two_ring_rejected():
+    """Ring index wrapping uses a bit mask, so leds_per_ring must be a power of two."""
+    with pytest.raises(ValueError, match="power of two"):
+        DotStyle(max_brightness=MAX_BRIGHTNESS, spec=ArcSpec(leds_per_ring=60))
@@ -17,6 +17,7 @@ import pytest
 from arc.enums.enums import LfoStyle, ValueStyle
 from arc.models.model import Model, RingState
 from arc.services.lfo.lfo_engine import LFOEngine
+from arc.utils.hardware_spec import ARC_SPEC
 
 
 class TestLFOEngine:
@@ -36,7 +37,7 @@ class TestLFOEngine:
         assert engine.fps == 60
         assert engine.running is False
         assert engine._task is None
-        assert engine._lfos_on_model == {}
+        assert engine._lfos_on_model == []
 
     def test_start(self):
         """start()メソッドが非同期タスクを作成し、実行フラグを立てることを確認"""
@@ -139,18 +140,16 @@ class TestLFOEngine:
         mock_get_lfo_instance.return_value = mock_lfo
 
         ring_state = RingState(lfo_style=LfoStyle.PERLIN)
-        key = (0, 0)
+        slot = 0
 
-        lfo = engine._get_or_create_lfo(key, ring_state)
+        lfo = engine._get_or_create_lfo(slot, ring_state)
 
-        assert key in engine._lfos_on_model
-        assert engine._lfos_on_model[key] == lfo
+        assert engine._lfos_on_model[slot] == lfo
         assert lfo.__class__.__name__ == "PerlinLfoStyle"
         mock_get_lfo_instance.assert_called_once_with(LfoStyle.PERLIN)
 
     @patch("arc.services.lfo.lfo_engine.get_lfo_instance")
-    @patch("arc.services.lfo.lfo_engine.LFO_STYLE_MAP")
-    def test_get_or_create_lfo_cached(self, mock_lfo_style_map, mock_get_lfo_instance):
+    def test_get_or_create_lfo_cached(self, mock_get_lfo_instance):
         """同じキーに対してキャッシュからLFOインスタンスが取得されることを確認"""
         model = Mock()
         led_renderer = Mock()
@@ -160,20 +159,15 @@ class TestLFOEngine:
         # Mock LFO instance to avoid coroutine warnings
         mock_lfo = Mock()
         mock_lfo.__class__.__name__ = "PerlinLfoStyle"
-
-        # Set up the mock class to match the actual implementation
-        mock_lfo_class = type(mock_lfo)
-        mock_lfo.__class__ = mock_lfo_class
-        mock_lfo_style_map.get.return_value = mock_lfo_class
         mock_get_lfo_instance.return_value = mock_lfo
 
         ring_state = RingState(lfo_style=LfoStyle.PERLIN)
-        key = (0, 0)
+        slot = 0
 
         # First call creates
-        lfo1 = engine._get_or_create_lfo(key, ring_state)
+        lfo1 = engine._get_or_create_lfo(slot, ring_state)
         # Second call retrieves from cache (should use same instance)
-        lfo2 = engine._get_or_create_lfo(key, ring_state)
+        lfo2 = engine._get_or_create_lfo(slot, ring_state)
 
         assert lfo1 is lfo2
         # get_lfo_instance should only be called once due to caching
@@ -195,15 +189,15 @@ class TestLFOEngine:
 
         mock_get_lfo_instance.side_effect = [mock_lfo1, mock_lfo2]
 
-        key = (0, 0)
+        slot = 0
 
         # Create with PERLIN style
         ring_state1 = RingState(lfo_style=LfoStyle.PERLIN)
-        lfo1 = engine._get_or_create_lfo(key, ring_state1)
+        lfo1 = engine._get_or_create_lfo(slot, ring_state1)
 
         # Change to RANDOM_EASE style
         ring_state2 = RingState(lfo_style=LfoStyle.RANDOM_EASE)
-        lfo2 = engine._get_or_create_lfo(key, ring_state2)
+        lfo2 = engine._get_or_create_lfo(slot, ring_state2)
 
         assert lfo1 is not lfo2
         assert lfo1.__class__.__name__ == "PerlinLfoStyle"
@@ -227,24 +221,59 @@ class TestLFOEngine:
         midi_sender.send_cc_7bit.assert_not_called()
         midi_sender.send_cc_14bit.assert_not_called()
 
-    def test_update_ring_active_layer(self):
-        """アクティブレイヤーのみLEDレンダリングが行われることを確認"""
+    def test_update_ring_does_not_render(self):
+        """_update_ring は値の更新と送信のみを行い、LED 描画は行わないことを確認"""
         model = Mock()
         model.active_layer_idx = 1
         led_renderer = Mock()
         midi_sender = Mock()
         engine = LFOEngine(model, led_renderer, midi_sender, fps=60)
 
-        ring_state = RingState(lfo_style=LfoStyle.PERLIN, value=0.5, cc_number=1)
+        ring_state = RingState(
+            lfo_style=LfoStyle.PERLIN, value_style=ValueStyle.MIDI_7BIT, value=0.5, cc_number=1
+        )
 
-        # Update ring on active layer
         engine._update_ring(1, 0, ring_state, 0.016)
-        led_renderer.render_value.assert_called_once_with(0, ring_state)
 
-        # Update ring on inactive layer
-        led_renderer.reset_mock()
-        engine._update_ring(0, 0, ring_state, 0.016)
         led_renderer.render_value.assert_not_called()
+        midi_sender.send_cc_7bit.assert_called_once_with(1, ring_state.value)
+
+    def test_render_active_layer(self):
+        """アクティブレイヤーの LFO 有効リングのみ描画され、最後に 1 回 flush されることを確認"""
+        model = Model(num_layers=2)
+        model.active_layer_idx = 1
+        for layer in model.layers:
+            for ring in layer:
+                ring.lfo_style = LfoStyle.STATIC
+        model.layers[0].rings[0].lfo_style = LfoStyle.PERLIN
+        active_ring = model.layers[1].rings[2]
+        active_ring.lfo_style = LfoStyle.SINE
+        led_renderer = Mock()
+        engine = LFOEngine(model, led_renderer, Mock(), fps=60)
+
+        engine._render_active_layer()
+
+        led_renderer.render_value.assert_called_once_with(2, active_ring)
+        led_renderer.flush.assert_called_once()
+
+    @patch("arc.services.lfo.lfo_engine.get_lfo_instance")
+    def test_update_ring_keeps_one_lfo_per_layer_and_ring(self, mock_get_lfo_instance):
+        """(layer_idx, ring_idx) ごとに別々の LFO が保持され、互いに取り違えないことを確認"""
+        engine = LFOEngine(Mock(), Mock(), Mock(), fps=60)
+        n_layers, n_rings = 4, ARC_SPEC.rings_per_device
+        lfos = [Mock(**{"update.return_value": 0.5}) for _ in range(n_layers * n_rings)]
+        mock_get_lfo_instance.side_effect = lfos
+        rings = {(l, r): RingState(lfo_style=LfoStyle.SINE) for l in range(n_layers) for r in range(n_rings)}
+
+        for _ in range(2):
+            for (layer_idx, ring_idx), ring_state in rings.items():
+                engine._update_ring(layer_idx, ring_idx, ring_state, 0.016)
+
+        assert mock_get_lfo_instance.call_count == n_layers * n_rings
+        for lfo, ring_state in zip(lfos, rings.values()):
+            # RingState は値で等価比較されるため、同一性で確認する
+            assert lfo.update.call_count == 2
+            assert all(c.args[0] is ring_state for c in lfo.update.call_args_list)
 
     def test_send_if_needed_value_change(self):
         """値が変更された時にMIDI/OSCが送信されることを確認（7bit/14bit両方）"""
@@ -327,6 +356,82 @@ class TestLFOEngine:
         assert engine.running is False
         assert engine._task is None
 
+    @pytest.mark.asyncio
+    async def test_loop_idles_until_wake_when_all_static(self):
+        """全リングが STATIC の間はループが休止し、wake() で再開することを確認"""
+        model = Model(num_layers=1)
+        for ring in model.layers[0]:
+            ring.lfo_style = LfoStyle.STATIC
+        engine = LFOEngine(model, Mock(), Mock(), fps=60)
+
+        with patch.object(engine, "_update_ring") as mock_update:
+            engine.start()
+            await asyncio.sleep(0.05)
+            mock_update.assert_not_called()
+
+            model.layers[0].rings[0].lfo_style = LfoStyle.SINE
+            engine.wake()
+            await asyncio.sleep(0.05)
+            assert mock_update.call_count > 0
+
+            await engine.stop()
+
+
+    @pytest.mark.asyncio
+    async def test_loop_parks_when_rings_turn_static(self):
+        """全リング走査は起動時だけで、更新中に全リングが STATIC になると次の周回で休止することを確認"""
+        model = Model(num_layers=1)
+        for ring in model.layers[0]:
+            ring.lfo_style = LfoStyle.STATIC
+        model.layers[0].rings[0].lfo_style = LfoStyle.SINE
+        engine = LFOEngine(model, Mock(), Mock(), fps=60)
+
+        with patch.object(engine, "_has_active_lfo", wraps=engine._has_active_lfo) as scan:
+            with patch.object(engine, "_update_ring") as mock_update:
+                engine.start()
+                await asyncio.sleep(0.05)
+                assert mock_update.call_count > 1
+                assert scan.call_count == 1  # フレームごとには走査しない
+
+                model.layers[0].rings[0].lfo_style = LfoStyle.STATIC
+                await asyncio.sleep(0.05)
+                parked_count = mock_update.call_count
+                await asyncio.sleep(0.05)
+                assert mock_update.call_count == parked_count
+
+                await engine.stop()
+
+
+    @pytest.mark.asyncio
+    async def test_wake_during_all_static_frame_is_not_lost(self):
+        """全リング STATIC のフレームの sleep 中に wake() されても、休止せずに更新を再開することを確認"""
+        model = Model(num_layers=1)
+        for ring in model.layers[0]:
+            ring.lfo_style = LfoStyle.STATIC
+        ring = model.layers[0].rings[1]
+        ring.lfo_style = LfoStyle.SINE
+        engine = LFOEngine(model, Mock(), Mock(), fps=60)
+        real_sleep = asyncio.sleep
+        sleeps = 0
+
+        async def fake_sleep(_delay):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps == 1:
+                ring.lfo_style = LfoStyle.STATIC  # 次のフレームは有効リング 0
+            elif sleeps == 2:
+                ring.lfo_style = LfoStyle.SINE  # その sleep 中に LFO を有効化して起こす
+                engine.wake()
+            else:
+                engine.running = False
+            await real_sleep(0)
+
+        engine.running = True
+        with patch.object(engine, "_update_ring") as mock_update, patch("asyncio.sleep", fake_sleep):
+            await asyncio.wait_for(engine._loop(), timeout=1.0)
+
+        assert mock_update.call_count == 2  # 1 フレーム目と、起床後のフレーム
+
 
 class TestLFOEngineIntegration:
     """実際のModelを使用した統合テスト"""
@@ -367,9 +472,7 @@ class TestLFOEngineIntegration:
             except asyncio.CancelledError:
                 pass
 
-        # Verify LFO was created for PERLIN ring
-        assert (0, 0) in engine._lfos_on_model
-        assert engine._lfos_on_model[(0, 0)].__class__.__name__ == "PerlinLfoStyle"
-
-        # Verify STATIC ring was skipped
-        assert (0, 1) not in engine._lfos_on_model
+        # Verify LFO was updated for PERLIN ring and STATIC ring was skipped
+        updated = [c.args[0] for c in mock_lfo.update.call_args_list]
+        assert any(ring is model.layers[0].rings[0] for ring in updated)
+        assert all(ring is not model.layers[0].rings[1] for ring in updated)
@@ -1,19 +1,46 @@
 """src.services.lfo.lfo_styles の決定的な LFO スタイルクラスのテスト。"""
 
 import math
+from unittest.mock import patch
 
 import pytest
-from models.model import RingState
-from services.lfo.lfo_styles import (
+from arc.models.model import RingState
+from arc.services.lfo.lfo_styles import (
+    PerlinLfoStyle,
     RandomEaseLfoStyle,
     SawLfoStyle,
     SineLfoStyle,
     SquareLfoStyle,
     StaticLfoStyle,
     TriangleLfoStyle,
+    get_lfo_instance,
 )
 
 
+def test_get_lfo_instance_is_cached():
+    """get_lfo_instance はスタイルごとに同じインスタンスを返す必要がある。"""
+    sine = get_lfo_instance(SineLfoStyle.style())
+
+    assert isinstance(sine, SineLfoStyle)
+    assert get_lfo_instance(SineLfoStyle.style()) is sine
+    assert get_lfo_instance(SawLfoStyle.style()) is not sine
+
+
+def test_get_lfo_instance_random_ease_keeps_per_cc_state():
+    """キャッシュされた RandomEaseLfoStyle は cc_number ごとの状態を呼び出し間で保持する必要がある。"""
+    style = get_lfo_instance(RandomEaseLfoStyle.style())
+    style._states.clear()
+    ring = RingState(lfo_frequency=0.5, lfo_amplitude=1.0, cc_number=7)
+
+    style.update(ring, dt=0.1)
+    state = style._states[7]
+    get_lfo_instance(RandomEaseLfoStyle.style()).update(ring, dt=0.1)
+
+    assert get_lfo_instance(RandomEaseLfoStyle.style()) is style
+    assert style._states[7] is state
+    assert state["timer"] == pytest.approx(0.2)
+
+
 def test_static_lfo_returns_current_value():
     """StaticLfoStyle は位相を変更せずに `current_value` をエコーする必要がある。"""
     ring = RingState(value=0.123, lfo_amplitude=0.9)
@@ -49,6 +76,30 @@ def test_sine_lfo_phase_wrap():
     assert out == pytest.approx(expected)
 
 
+def test_sine_lfo_zero_amplitude_keeps_phase():
+    """振幅 0 の SineLfoStyle は 0 を返しつつ位相は進める必要がある。"""
+    ring = RingState(lfo_frequency=1.0, lfo_amplitude=0.0, lfo_phase=0.0)
+    style = SineLfoStyle()
+
+    out = style.update(ring, dt=0.25)
+
+    assert out == 0.0
+    assert ring.lfo_phase == pytest.approx(0.25)
+
+
+def test_perlin_lfo_zero_amplitude_keeps_phase():
+    """振幅 0 の PerlinLfoStyle はノイズを評価せず 0 を返しつつ位相は進める必要がある。"""
+    ring = RingState(lfo_frequency=1.0, lfo_amplitude=0.0, lfo_phase=0.0, cc_number=3)
+    style = PerlinLfoStyle()
+
+    with patch("arc.services.lfo.lfo_styles.noise.pnoise1") as pnoise1:
+        out = style.update(ring, dt=0.25)
+
+    assert out == 0.0
+    assert ring.lfo_phase == pytest.approx(0.25)
+    pnoise1.assert_not_called()
+
+
 def test_saw_lfo_value():
     """SawLfoStyle は -amp から +amp への線形ランプを生成する必要がある。"""
     ring = RingState(lfo_frequency=1.0, lfo_amplitude=1.0, lfo_phase=0.0)
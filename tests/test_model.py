@@ -161,6 +161,18 @@ class TestRingState:
         ring.cycle_preset(1)
         assert ring.preset_index == 0
 
+    def test_render_signature(self):
+        """描画に影響しない属性の変更では render_signature が変わらないことを確認"""
+        ring = RingState()
+        before = ring.render_signature
+
+        ring.lfo_style = LfoStyle.SINE
+        ring.preset_index = 1
+        assert ring.render_signature == before
+
+        ring.value = 0.7
+        assert ring.render_signature != before
+
 
 class TestLayerState:
     """LayerState の基本機能テスト"""
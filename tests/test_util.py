@@ -1,7 +1,7 @@
 import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
-from arc.utils.util import clamp
+from arc.utils.util import clamp, fmt
 
 
 @pytest.mark.parametrize(
@@ -58,3 +58,17 @@ def test_clamp_invalid_bounds_raises():
     """lo > hi の場合は ValueError を送出することを期待"""
     with pytest.raises(ValueError):
         clamp(0, 10, 0)
+
+
+@pytest.mark.parametrize(
+    "v, expected",
+    [
+        (0.5, "0.500"),  # float は小数 3 桁
+        (1, "1"),  # int はそのまま
+        (True, "True"),  # bool は int のサブクラスだが str() で整形
+        ("abc", "abc"),
+    ],
+)
+def test_fmt(v, expected):
+    """fmt() は float のみ小数 3 桁へ丸め、それ以外は str() を返す"""
+    assert fmt(v) == expected